@@ -4,13 +4,38 @@ News Sources Health Check Script
 Verifies if RSS feeds are alive and returning valid data
 """
 
+import argparse
+import io
 import json
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import socket
+import sys
+import threading
 import time
 
+try:
+    # lxml is optional: its C streaming parser is faster than the stdlib one
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+try:
+    # orjson is optional: it reads and writes the JSON files several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
 # Color codes for terminal output
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -18,80 +43,373 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# Feed element names (RSS items and Atom entries)
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+RSS_ITEM = 'item'
+ATOM_ENTRY = f'{ATOM_NS}entry'
+ITEM_TAGS = (RSS_ITEM, ATOM_ENTRY)
+
+XML_PARSE_ERRORS = (ET.ParseError,) if LET is None else (ET.ParseError, LET.XMLSyntaxError)
+
+# Stop reading a feed once this many items have been counted
+MAX_ITEMS_COUNTED = 50
+
+# Size of the chunks streamed from the response into the parser
+CHUNK_SIZE = 8192
+
+# Give up on a response once this many (decoded) bytes were read without
+# reaching MAX_ITEMS_COUNTED items
+MAX_FEED_BYTES = 5 * 1024 * 1024
+
+# Query parameters that only track the referrer and never change the feed
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid'})
+
+# Maximum number of concurrent requests sent to a single host, so feeds
+# sharing a CDN (e.g. feedburner) are not throttled by a connection burst
+MAX_PER_HOST = 4
+
+# Per-feed validators and parsed summaries persisted between runs
+FEED_CACHE_FILE = Path.home() / '.cache' / 'signalforge' / 'feed_cache.json'
+
+# Seconds allowed to establish a connection; unreachable hosts fail on
+# this instead of waiting out the full read timeout
+CONNECT_TIMEOUT = 5
+
+# Maximum number of sources checked concurrently
+MAX_WORKERS = 32
+
+# Number of per-host connection pools kept alive, so keep-alive connections
+# to a host survive while checks for many other hosts run
+MAX_HOST_POOLS = 256
 
-def check_source_health(source_name: str, feed_url: str, timeout: int = 15) -> Tuple[bool, str, int]:
+
+def create_session() -> requests.Session:
     """
-    Check if a news source is healthy and returning data
+    Create an HTTP session with keep-alive connection pooling and retries
 
-    Returns:
-        (is_healthy, status_message, item_count)
+    Transient gateway errors are retried with backoff instead of marking
+    the source as broken on the first failure.
     """
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+    # At most MAX_PER_HOST requests run against one host at a time, so that
+    # many connections per host are enough to never open a throwaway one
+    adapter = HTTPAdapter(pool_connections=MAX_HOST_POOLS, pool_maxsize=MAX_PER_HOST, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    return session
+
+
+# Shared session, reused across checks so repeat hosts skip TCP/TLS setup
+SESSION = create_session()
+
+# Per-host request slots, created lazily
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def host_slot(feed_url: str) -> threading.BoundedSemaphore:
+    """Get the semaphore limiting concurrent requests to the feed's host"""
+    host = urlsplit(feed_url).netloc.lower()
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+    return slot
+
+
+@contextmanager
+def cached_dns():
+    """
+    Memoize socket.getaddrinfo() for the duration of a run
+
+    Every new connection resolves its host; with several feeds per host
+    and concurrent checks, the same name would otherwise be looked up
+    repeatedly. Failed lookups are not cached. The resolver is only
+    patched inside the ``with`` block (main() wraps the run in it) and is
+    restored on exit, even on error, so importing this module or calling
+    check_source_health() on its own leaves socket untouched.
+    """
+    original_getaddrinfo = socket.getaddrinfo
+    resolved: Dict[tuple, list] = {}
+
+    def getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        addresses = resolved.get(key)
+        if addresses is None:
+            addresses = resolved[key] = original_getaddrinfo(*key)
+        return addresses
+
+    socket.getaddrinfo = getaddrinfo
     try:
-        # Fetch RSS feed
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        yield
+    finally:
+        socket.getaddrinfo = original_getaddrinfo
 
-        start_time = time.time()
-        response = requests.get(feed_url, headers=headers, timeout=timeout)
-        response_time = time.time() - start_time
 
-        # Check HTTP status
-        if response.status_code != 200:
-            return False, f"HTTP {response.status_code}", 0
+@dataclass(slots=True)
+class SourceResult:
+    """Outcome of a single source health check"""
 
-        # Parse XML
-        try:
-            root = ET.fromstring(response.content)
-        except ET.ParseError as e:
-            return False, f"XML Parse Error: {str(e)[:50]}", 0
+    name: str
+    url: str
+    healthy: bool
+    status: str
+    items: int = 0
+    response_time: Optional[float] = None
 
-        # Check for items (RSS or Atom)
-        items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-        item_count = len(items)
 
-        if item_count == 0:
-            return False, "No items found in feed", 0
+def normalize_feed_url(feed_url: str) -> str:
+    """
+    Canonicalize a feed URL so that trivially different spellings compare equal
+
+    Lowercases the scheme and host, strips a trailing slash from the path,
+    and drops the fragment and tracking query parameters (utm_* and friends).
+    """
+    parts = urlsplit(feed_url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
+class FeedTooLargeError(Exception):
+    """Raised when a response body exceeds MAX_FEED_BYTES"""
+
+
+def capped_chunks(chunks: Iterable[bytes], max_bytes: int = MAX_FEED_BYTES) -> Iterator[bytes]:
+    """Pass chunks through, raising FeedTooLargeError once more than ``max_bytes`` were read"""
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        if total > max_bytes:
+            raise FeedTooLargeError(f"Response too large (>{max_bytes // (1024 * 1024)} MB)")
+        yield chunk
 
-        # Check if first item has required fields
-        first_item = items[0]
 
-        # Find title
-        title_elem = first_item.find('title') or first_item.find('{http://www.w3.org/2005/Atom}title')
+def make_item_inspector(title_tag: str, link_tag: str) -> Callable[[Any], Tuple[str, bool]]:
+    """
+    Build a first-item inspector with one feed format's tag names baked in
+
+    The returned function reads title text and link presence in a single
+    pass over the item's children.
+    """
+    def inspect_item(item) -> Tuple[str, bool]:
         title_text = ''
-        if title_elem is not None and title_elem.text:
-            title_text = title_elem.text.strip()
+        has_link = False
+
+        for child in item:
+            tag = child.tag
+            if tag == title_tag:
+                if child.text:
+                    title_text = child.text.strip()
+            elif tag == link_tag:
+                has_link = True
+
+        return title_text, has_link
+
+    return inspect_item
+
+
+# First-item inspector for each item tag, picked once per feed
+FIRST_ITEM_INSPECTORS = {
+    RSS_ITEM: make_item_inspector('title', 'link'),
+    ATOM_ENTRY: make_item_inspector(f'{ATOM_NS}title', f'{ATOM_NS}link'),
+}
+
+
+def scan_feed_items(
+    chunks: Iterable[bytes],
+    max_items: int = MAX_ITEMS_COUNTED
+) -> Tuple[int, str, bool]:
+    """
+    Incrementally parse a feed, counting items and inspecting only the first one
+
+    Chunks are fed to a pull parser as they arrive, items are cleared as
+    soon as they are counted, and parsing stops once ``max_items`` items
+    have been seen, so large feeds are neither fully downloaded nor kept
+    in memory.
+
+    Returns:
+        (item_count, first_item_title, first_item_has_link)
+    """
+    if LET is not None:
+        parser = LET.XMLPullParser(events=('end',), tag=ITEM_TAGS, recover=True, huge_tree=False)
+    else:
+        parser = ET.XMLPullParser(events=('end',))
+
+    item_count = 0
+    title_text = ''
+    has_link = False
+    item_tag = None
 
+    def consume_events() -> bool:
+        """Process pending parser events; return True once enough items were seen"""
+        nonlocal item_count, title_text, has_link, item_tag
+
+        for _, elem in parser.read_events():
+            if elem.tag != item_tag:
+                # Until the first item is seen, item_tag is None; that item
+                # decides whether this is an RSS or Atom feed
+                if item_tag is not None or elem.tag not in FIRST_ITEM_INSPECTORS:
+                    continue
+                item_tag = elem.tag
+                title_text, has_link = FIRST_ITEM_INSPECTORS[item_tag](elem)
+
+            item_count += 1
+            elem.clear()
+
+            if item_count >= max_items:
+                return True
+
+        return False
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        if consume_events():
+            return item_count, title_text, has_link
+
+    parser.close()
+    consume_events()
+
+    return item_count, title_text, has_link
+
+
+def check_source_health(
+    source_name: str,
+    feed_url: str,
+    timeout: int = 15,
+    session: Optional[requests.Session] = None,
+    feed_cache: Optional[Dict[str, Any]] = None
+) -> SourceResult:
+    """
+    Check if a news source is healthy and returning data
+
+    Uses the module-level SESSION unless a ``session`` is given. When a
+    ``feed_cache`` is given, a conditional GET is sent with the stored
+    ETag/Last-Modified; on HTTP 304 the cached summary is reused without
+    downloading or parsing the feed, and healthy results update the cache.
+
+    Returns:
+        SourceResult describing the check outcome
+    """
+    try:
+        cached = feed_cache.get(feed_url) if feed_cache is not None else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        # Limit concurrent requests per host; latency is timed once a slot is held
+        with host_slot(feed_url):
+            # Fetch RSS feed (streamed, so the body is only read as far as needed)
+            start_time = time.perf_counter()
+            # Dead hosts fail on the short connect timeout, and failing statuses
+            # return before any of the body is read, so no separate HEAD probe
+            # is needed to avoid downloading broken feeds
+            with (session or SESSION).get(
+                feed_url,
+                headers=headers,
+                timeout=(min(CONNECT_TIMEOUT, timeout), timeout),
+                stream=True
+            ) as response:
+                # Feed unchanged since the last run
+                if response.status_code == 304 and cached:
+                    item_count = cached['parsed']['items']
+                    return SourceResult(source_name, feed_url, True, f"OK (304 cached, {item_count} items)",
+                                        item_count)
+
+                # Check HTTP status
+                if response.status_code != 200:
+                    return SourceResult(source_name, feed_url, False, f"HTTP {response.status_code}")
+
+                # An HTML page (error or login wall) is never a feed; skip parsing it
+                content_type = response.headers.get('Content-Type', '').lower()
+                if 'html' in content_type and 'xml' not in content_type:
+                    return SourceResult(source_name, feed_url, False, f"Not a feed ({content_type.split(';')[0]})")
+
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+
+                # Parse XML
+                try:
+                    item_count, title_text, has_link = scan_feed_items(
+                        capped_chunks(response.iter_content(CHUNK_SIZE))
+                    )
+                except XML_PARSE_ERRORS as e:
+                    return SourceResult(source_name, feed_url, False, f"XML Parse Error: {str(e)[:50]}")
+                except FeedTooLargeError as e:
+                    return SourceResult(source_name, feed_url, False, str(e))
+
+            response_time = time.perf_counter() - start_time
+
+        # Check for items (RSS or Atom)
+        if item_count == 0:
+            return SourceResult(source_name, feed_url, False, "No items found in feed")
+
+        # Check if first item has required fields
         if not title_text:
-            return False, "Items missing title", item_count
+            return SourceResult(source_name, feed_url, False, "Items missing title", item_count)
 
-        # Find link
-        link_elem = first_item.find('link') or first_item.find('{http://www.w3.org/2005/Atom}link')
-        if link_elem is None:
-            return False, "Items missing link", item_count
+        if not has_link:
+            return SourceResult(source_name, feed_url, False, "Items missing link", item_count)
 
         # All checks passed
+        if feed_cache is not None and (etag or last_modified):
+            feed_cache[feed_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'parsed': {'items': item_count, 'title': title_text}
+            }
+
         status_msg = f"OK ({response_time:.2f}s, {item_count} items)"
-        return True, status_msg, item_count
+        return SourceResult(source_name, feed_url, True, status_msg, item_count, response_time)
 
+    except requests.exceptions.ConnectTimeout:
+        return SourceResult(source_name, feed_url, False, f"Connect Timeout (>{min(CONNECT_TIMEOUT, timeout)}s)")
     except requests.exceptions.Timeout:
-        return False, f"Timeout (>{timeout}s)", 0
+        return SourceResult(source_name, feed_url, False, f"Timeout (>{timeout}s)")
     except requests.exceptions.ConnectionError:
-        return False, "Connection Error", 0
+        return SourceResult(source_name, feed_url, False, "Connection Error")
     except requests.exceptions.TooManyRedirects:
-        return False, "Too Many Redirects", 0
+        return SourceResult(source_name, feed_url, False, "Too Many Redirects")
     except requests.exceptions.RequestException as e:
-        return False, f"Request Error: {str(e)[:50]}", 0
+        return SourceResult(source_name, feed_url, False, f"Request Error: {str(e)[:50]}")
     except Exception as e:
-        return False, f"Unknown Error: {str(e)[:50]}", 0
+        return SourceResult(source_name, feed_url, False, f"Unknown Error: {str(e)[:50]}")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
 
 
 def load_sources(sources_file: str = "sources.json") -> Dict[str, str]:
     """Load sources from JSON file"""
     try:
-        with open(sources_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('sources', {})
+        data = json_loads(Path(sources_file).read_bytes())
+        return data.get('sources', {})
     except FileNotFoundError:
         print(f"{YELLOW}Warning: {sources_file} not found, using default sources{RESET}")
         # Default fallback sources
@@ -112,6 +430,23 @@ def load_sources(sources_file: str = "sources.json") -> Dict[str, str]:
         return {}
 
 
+def load_feed_cache(cache_file: Path = FEED_CACHE_FILE) -> Dict[str, Any]:
+    """Load the per-feed conditional request cache"""
+    try:
+        return json_loads(cache_file.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_feed_cache(feed_cache: Dict[str, Any], cache_file: Path = FEED_CACHE_FILE):
+    """Save the per-feed conditional request cache"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(json_dumps(feed_cache))
+    except OSError as e:
+        print(f"{YELLOW}Warning: Could not save feed cache to {cache_file}: {e}{RESET}")
+
+
 def save_working_sources(working_sources: Dict[str, str], output_file: str = "sources.json"):
     """Save working sources to JSON file"""
     data = {
@@ -120,14 +455,19 @@ def save_working_sources(working_sources: Dict[str, str], output_file: str = "so
         "total_sources": len(working_sources)
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    Path(output_file).write_bytes(json_dumps(data, indent=True))
 
     print(f"\n{GREEN}✓ Saved {len(working_sources)} working sources to {output_file}{RESET}")
 
 
-def main():
-    """Main health check function"""
+def main(mode: str = "detailed"):
+    """
+    Main health check function
+
+    Args:
+        mode: "simple" prints progress and the summary only; "detailed"
+            (default) also prints the per-source report
+    """
     print(f"{BLUE}{'='*80}{RESET}")
     print(f"{BLUE}🏥 News Sources Health Check{RESET}")
     print(f"{BLUE}{'='*80}{RESET}\n")
@@ -139,32 +479,53 @@ def main():
         print(f"{RED}Error: No sources to check{RESET}")
         return
 
-    print(f"Checking {len(sources)} news sources...\n")
+    # Sources that share a feed URL (under different names) are checked once
+    names_by_url = defaultdict(list)
+    for source_name, feed_url in sources.items():
+        names_by_url[normalize_feed_url(feed_url)].append(source_name)
+
+    if len(names_by_url) < len(sources):
+        print(f"Checking {len(sources)} news sources ({len(names_by_url)} unique feeds)...\n")
+    else:
+        print(f"Checking {len(sources)} news sources...\n")
 
     # Check each source
-    results = []
-    working_sources = {}
-    broken_sources = {}
-
-    for i, (source_name, feed_url) in enumerate(sources.items(), 1):
-        print(f"[{i}/{len(sources)}] {source_name:25s} ", end='', flush=True)
-
-        is_healthy, status_msg, item_count = check_source_health(source_name, feed_url)
-
-        results.append({
-            'name': source_name,
-            'url': feed_url,
-            'healthy': is_healthy,
-            'status': status_msg,
-            'items': item_count
-        })
-
-        if is_healthy:
-            print(f"{GREEN}✓ {status_msg}{RESET}")
-            working_sources[source_name] = feed_url
-        else:
-            print(f"{RED}✗ {status_msg}{RESET}")
-            broken_sources[source_name] = feed_url
+    results_by_name = {}
+    feed_cache = load_feed_cache()
+    completed = 0
+
+    # Checks are network-bound, so run them concurrently; total time is
+    # bounded by the slowest feed instead of the sum of all of them.
+    # Progress is printed as checks finish, so one slow feed does not hold
+    # back the others.
+    # Parsing stays in these threads rather than a process pool: it is
+    # interleaved with the download and stops after MAX_ITEMS_COUNTED
+    # items, so shipping whole bodies to worker processes would cost more
+    # than the bounded parse it offloads.
+    with cached_dns(), ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(names_by_url))) as executor:
+        futures = {
+            executor.submit(check_source_health, names[0], sources[names[0]], feed_cache=feed_cache): names
+            for names in names_by_url.values()
+        }
+
+        for future in as_completed(futures):
+            checked = future.result()
+
+            # Fan the result out to every source sharing this feed
+            for source_name in futures[future]:
+                completed += 1
+                result = replace(checked, name=source_name, url=sources[source_name])
+                results_by_name[source_name] = result
+
+                marker = f"{GREEN}✓" if result.healthy else f"{RED}✗"
+                print(f"[{completed}/{len(sources)}] {source_name:25s} {marker} {result.status}{RESET}")
+
+    save_feed_cache(feed_cache)
+
+    # Restore input order so the summary and report are deterministic
+    results = [results_by_name[name] for name in sources]
+    working_sources = {r.name: r.url for r in results if r.healthy}
+    broken_sources = {r.name: r.url for r in results if not r.healthy}
 
     # Print summary
     print(f"\n{BLUE}{'='*80}{RESET}")
@@ -183,14 +544,14 @@ def main():
     if working_sources:
         print(f"{GREEN}Working Sources:{RESET}")
         for name in working_sources:
-            item_count = next(r['items'] for r in results if r['name'] == name)
+            item_count = results_by_name[name].items
             print(f"  ✓ {name:25s} ({item_count} articles)")
 
     # Show broken sources
     if broken_sources:
         print(f"\n{RED}Broken Sources:{RESET}")
         for name in broken_sources:
-            status = next(r['status'] for r in results if r['name'] == name)
+            status = results_by_name[name].status
             print(f"  ✗ {name:25s} - {status}")
 
     # Save working sources
@@ -199,19 +560,34 @@ def main():
     else:
         print(f"\n{RED}Warning: No working sources found!{RESET}")
 
-    # Generate detailed report
-    print(f"\n{BLUE}Detailed Report{RESET}")
-    print(f"{BLUE}{'='*80}{RESET}\n")
+    if mode != "detailed":
+        return
+
+    # Generate detailed report, built in memory and written in one call
+    report = io.StringIO()
+    report.write(f"\n{BLUE}Detailed Report{RESET}\n")
+    report.write(f"{BLUE}{'='*80}{RESET}\n\n")
 
     for result in results:
-        status_icon = f"{GREEN}✓{RESET}" if result['healthy'] else f"{RED}✗{RESET}"
-        print(f"{status_icon} {result['name']}")
-        print(f"  URL: {result['url']}")
-        print(f"  Status: {result['status']}")
-        if result['items'] > 0:
-            print(f"  Items: {result['items']}")
-        print()
+        status_icon = f"{GREEN}✓{RESET}" if result.healthy else f"{RED}✗{RESET}"
+        report.write(f"{status_icon} {result.name}\n")
+        report.write(f"  URL: {result.url}\n")
+        report.write(f"  Status: {result.status}\n")
+        if result.items > 0:
+            report.write(f"  Items: {result.items}\n")
+        report.write("\n")
 
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Check that the RSS/Atom feeds in sources.json are healthy")
+    parser.add_argument(
+        "--mode",
+        choices=["simple", "detailed"],
+        default="detailed",
+        help="simple: progress and summary only; detailed (default): also print the per-source report"
+    )
+    args = parser.parse_args()
+
+    main(mode=args.mode)
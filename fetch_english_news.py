@@ -4,15 +4,97 @@ English Tech News Aggregator for SignalForge
 Fetches news from major English tech publications
 """
 
+import gzip
+import hashlib
+import html
 import json
+import logging
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import Any, Iterator, List, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import requests
-from collections import defaultdict
+from requests.adapters import HTTPAdapter
+import random
 import re
 from email.utils import parsedate_to_datetime
+from operator import itemgetter
 import os
+import sys
+
+log = logging.getLogger("signalforge.news")
+
+try:
+    # lxml is optional: its C parser is several times faster than the stdlib one
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+# Maximum number of feeds fetched concurrently
+MAX_WORKERS = 10
+
+# (connect, read) timeout in seconds for feed requests
+FETCH_TIMEOUT = (5, 20)
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session whose keep-alive connections are shared by all fetches"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Feed element names (RSS items and Atom entries)
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_DATE = '{http://purl.org/dc/elements/1.1/}date'
+RSS_ITEM = 'item'
+ATOM_ENTRY = f'{ATOM_NS}entry'
+ITEM_TAGS = (RSS_ITEM, ATOM_ENTRY)
+
+
+class FeedTags(NamedTuple):
+    """Child element names of an item in one feed format"""
+
+    title: str
+    link: str
+    guid: Optional[str]
+    dates: Tuple[str, ...]  # publication date elements, in order of preference
+
+
+# Child tag names for each item tag, resolved once per feed
+FEED_TAGS = {
+    RSS_ITEM: FeedTags('title', 'link', 'guid', ('pubDate', 'published', 'updated', DC_DATE)),
+    ATOM_ENTRY: FeedTags(f'{ATOM_NS}title', f'{ATOM_NS}link', None, (f'{ATOM_NS}published', f'{ATOM_NS}updated', DC_DATE)),
+}
+
+# Publication time shown on news cards, formatted once per item
+CARD_TIME_FORMAT = "%b %d, %H:%M UTC"
+
+# ISO 8601 dates (Atom, dc:date) start with the year; anything else is RFC 822
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+XML_PARSE_ERRORS = (ET.ParseError,) if LET is None else (ET.ParseError, LET.XMLSyntaxError)
+
+# Query parameters that only track the referrer and never change the article
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'source'})
+
+# Runs of punctuation/whitespace, collapsed when building title signatures
+TITLE_SEPARATORS_RE = re.compile(r'[\W_]+')
+
+# Per-run state kept between runs: feed validators/items and the page digest
+CACHE_DIR = '.signalforge_cache'
+FEED_CACHE_FILE = os.path.join(CACHE_DIR, 'feeds.json')
+DIGEST_FILE = os.path.join(CACHE_DIR, 'digest')
+
+# Bump when generate_html's rendering code changes, so the next run re-renders
+# the page even if the news did not change (see RENDER_FINGERPRINT)
+RENDER_VERSION = 1
+
+# Shared session, so feeds on the same host reuse TCP/TLS connections
+SESSION = create_session()
 
 
 def load_sources_from_file(sources_file: str = "sources.json") -> Dict[str, str]:
@@ -23,7 +105,7 @@ def load_sources_from_file(sources_file: str = "sources.json") -> Dict[str, str]
                 data = json.load(f)
                 return data.get('sources', {})
     except Exception as e:
-        print(f"Warning: Could not load {sources_file}: {e}")
+        log.warning(f"Warning: Could not load {sources_file}: {e}")
 
     # Fallback to default sources
     return {
@@ -75,6 +157,39 @@ TECH_KEYWORDS = {
 }
 
 
+def keyword_alternation(keywords: List[str]) -> str:
+    """
+    Build a regex alternation matching any of a category's keywords in lowercased text
+
+    Keywords are lowercased here, once, and callers lowercase each title
+    once, so matching needs no IGNORECASE. Keywords must start at a word
+    boundary. Short keywords (acronyms such as "AI" or "GPU") must also end
+    at one, allowing a plural "s", so "AI" no longer matches inside
+    "mainframe"; longer keywords match as prefixes so "Hack" still matches
+    "Hackers".
+    """
+    alternatives = []
+    for keyword in keywords:
+        escaped = re.escape(keyword.lower())
+        alternatives.append(escaped + r's?\b' if len(keyword) <= 3 else escaped)
+
+    return r'\b(?:' + '|'.join(alternatives) + ')'
+
+
+# Categories in TECH_KEYWORDS priority order
+CATEGORIES = list(TECH_KEYWORDS)
+
+# All keywords in one pattern, with one named group per category (c0, c1, ...
+# in priority order), so a single scan of a title finds every category hit.
+# Each group sits in a lookahead so matches are zero-width and every start
+# position is tried: a keyword can't hide an overlapping one (e.g. "series a"
+# hiding "ai" in "Series AI startup")
+KEYWORD_PATTERN = re.compile('|'.join(
+    f'(?=(?P<c{index}>{keyword_alternation(TECH_KEYWORDS[category])}))'
+    for index, category in enumerate(CATEGORIES)
+))
+
+
 def extract_text_from_element(elem) -> str:
     """Robustly extract text from an XML element, handling CDATA and nested content"""
     if elem is None:
@@ -92,12 +207,126 @@ def extract_text_from_element(elem) -> str:
     return ''
 
 
-def fetch_news_from_source(source_name: str, feed_url: str, max_items: int = 10) -> List[Dict]:
-    """Fetch news from a single RSS feed source"""
+def iter_feed_items(stream) -> Iterator:
+    """
+    Stream-parse a feed, yielding each RSS <item> / Atom <entry> once it is complete
+
+    Yielded elements are cleared when the caller asks for the next one, so
+    only the item being processed is kept in memory.
+    """
+    if LET is not None:
+        for _, elem in LET.iterparse(stream, events=('end',), tag=ITEM_TAGS, recover=True, huge_tree=False):
+            yield elem
+            elem.clear()
+            # Also drop the emptied items from the tree
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _, elem in ET.iterparse(stream, events=('end',)):
+            if elem.tag in ITEM_TAGS:
+                yield elem
+                elem.clear()
+
+
+def parse_pub_date(date_text: str) -> Optional[datetime]:
+    """Parse an ISO 8601 or RFC 822 date, picking the parser from its format; None if invalid"""
+    if not date_text:
+        return None
+
+    try:
+        if ISO_DATE_RE.match(date_text):
+            return datetime.fromisoformat(date_text.replace('Z', '+00:00'))
+        return parsedate_to_datetime(date_text)
+    except (TypeError, ValueError):
+        return None
+
+
+def make_news_item(source_name: str, title: str, link: str, pub_date: datetime) -> Dict:
+    """
+    Build a news item dict
+
+    Besides the raw fields, the HTML-escaped source/title/link and the card
+    time string are computed here, once per item, so rendering a card is
+    plain template substitution.
+    """
+    return {
+        'source': source_name,
+        'title': title,
+        'link': link,
+        'published': pub_date,
+        'timestamp': pub_date.timestamp(),
+        'time_str': pub_date.astimezone(timezone.utc).strftime(CARD_TIME_FORMAT),
+        'source_safe': html.escape(source_name),
+        'title_safe': html.escape(title),
+        'link_safe': html.escape(link)
+    }
+
+
+def parse_news_item(item, source_name: str, tags: FeedTags) -> Optional[Dict]:
+    """
+    Build a news item dict from an RSS <item> or Atom <entry>, or None if it has no title or link
+
+    ``tags`` holds the child element names for the feed's format (see FEED_TAGS).
+    """
+    # Get title
+    title = extract_text_from_element(item.find(tags.title))
+
+    # Skip items without titles
+    if not title:
+        return None
+
+    # Get link - handle both text content and href attribute
+    link = ''
+    link_elem = item.find(tags.link)
+    if link_elem is not None:
+        link = link_elem.text if link_elem.text else link_elem.get('href', '')
+        link = link.strip() if link else ''
+
+    # Try guid (RSS only) as fallback for link
+    if not link and tags.guid:
+        guid_elem = item.find(tags.guid)
+        if guid_elem is not None and guid_elem.text:
+            link = guid_elem.text.strip()
+
+    # Skip items without valid links
+    if not link or not link.startswith('http'):
+        return None
+
+    # Get publication date from the first date element that parses
+    pub_date = None
+    for date_tag in tags.dates:
+        date_elem = item.find(date_tag)
+        if date_elem is not None:
+            pub_date = parse_pub_date(extract_text_from_element(date_elem))
+            if pub_date is not None:
+                break
+
+    if pub_date is None:
+        pub_date = datetime.now(timezone.utc)
+    elif pub_date.tzinfo is None:
+        pub_date = pub_date.replace(tzinfo=timezone.utc)
+
+    return make_news_item(source_name, title, link, pub_date)
+
+
+def fetch_news_from_source(
+    source_name: str,
+    feed_url: str,
+    max_items: int = 10,
+    session: Optional[requests.Session] = None,
+    feed_cache: Optional[Dict[str, Any]] = None
+) -> List[Dict]:
+    """
+    Fetch news from a single RSS feed source (using SESSION unless a session is given)
+
+    When a ``feed_cache`` is given, the request is sent with the ETag and
+    Last-Modified stored for the feed; on HTTP 304 the cached items are
+    reused without parsing, and freshly parsed items are stored back.
+    """
     news_items = []
 
     try:
-        print(f"Fetching from {source_name}...")
+        log.info(f"Fetching from {source_name}...")
 
         # Fetch RSS feed with robust headers
         headers = {
@@ -105,129 +334,190 @@ def fetch_news_from_source(source_name: str, feed_url: str, max_items: int = 10)
             'Accept': 'application/rss+xml, application/xml, text/xml, */*',
             'Accept-Language': 'en-US,en;q=0.9'
         }
-        response = requests.get(feed_url, headers=headers, timeout=20)
-        response.raise_for_status()
-
-        # Parse XML
-        root = ET.fromstring(response.content)
-
-        # Handle both RSS and Atom feeds
-        # RSS uses <item>, Atom uses <entry>
-        items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-
-        for item in items[:max_items]:
-            # Get title - try multiple methods
-            title_elem = item.find('title') or item.find('{http://www.w3.org/2005/Atom}title')
-            title = extract_text_from_element(title_elem)
-
-            # Skip items without titles
-            if not title:
-                continue
-
-            # Get link - handle both text content and href attribute
-            link = ''
-            link_elem = item.find('link') or item.find('{http://www.w3.org/2005/Atom}link')
-            if link_elem is not None:
-                link = link_elem.text if link_elem.text else link_elem.get('href', '')
-                link = link.strip() if link else ''
-
-            # Try guid as fallback for link
-            if not link:
-                guid_elem = item.find('guid')
-                if guid_elem is not None and guid_elem.text:
-                    link = guid_elem.text.strip()
-
-            # Skip items without valid links
-            if not link or not link.startswith('http'):
-                continue
-
-            # Get publication date
-            pub_date = None
-            for date_tag in ['pubDate', 'published', 'updated',
-                           '{http://www.w3.org/2005/Atom}published',
-                           '{http://www.w3.org/2005/Atom}updated',
-                           'dc:date', '{http://purl.org/dc/elements/1.1/}date']:
-                date_elem = item.find(date_tag)
-                if date_elem is not None:
-                    date_text = extract_text_from_element(date_elem)
-                    if date_text:
-                        try:
-                            pub_date = parsedate_to_datetime(date_text)
-                            break
-                        except:
-                            try:
-                                # Try ISO format
-                                pub_date = datetime.fromisoformat(date_text.replace('Z', '+00:00'))
-                                break
-                            except:
-                                pass
-
-            if pub_date is None:
-                pub_date = datetime.now(timezone.utc)
-            elif pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=timezone.utc)
-
-            news_items.append({
-                'source': source_name,
-                'title': title,
-                'link': link,
-                'published': pub_date,
-                'timestamp': pub_date.timestamp()
-            })
-
-        print(f"  ✓ Found {len(news_items)} items from {source_name}")
+        cached = feed_cache.get(feed_url) if feed_cache is not None else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        with (session or SESSION).get(feed_url, headers=headers, timeout=FETCH_TIMEOUT, stream=True) as response:
+            # Feed unchanged since the last run
+            if response.status_code == 304 and cached:
+                news_items = [restore_news_item(item, source_name) for item in cached['items']]
+                log.info(f"  ✓ Not modified, reusing {len(news_items)} items from {source_name}")
+                return news_items
+
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            # Stream-parse the feed: each item is handled as soon as it is
+            # complete, so the whole document is never held in memory, and
+            # reading stops (closing the connection with the rest of the
+            # body unread) once max_items usable items were collected.
+            # RSS uses <item>, Atom uses <entry>
+            tags = None
+            for elem in iter_feed_items(response.raw):
+                # The first item decides whether this is an RSS or Atom feed
+                if tags is None:
+                    tags = FEED_TAGS[elem.tag]
+
+                news_item = parse_news_item(elem, source_name, tags)
+                if news_item is None:
+                    continue
+
+                news_items.append(news_item)
+                if len(news_items) >= max_items:
+                    break
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        if feed_cache is not None and (etag or last_modified):
+            feed_cache[feed_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'items': [
+                    {'title': item['title'], 'link': item['link'], 'timestamp': item['timestamp']}
+                    for item in news_items
+                ]
+            }
+
+        log.info(f"  ✓ Found {len(news_items)} items from {source_name}")
 
     except requests.exceptions.RequestException as e:
-        print(f"  ✗ Network error fetching from {source_name}: {str(e)[:100]}")
-    except ET.ParseError as e:
-        print(f"  ✗ XML parse error from {source_name}: {str(e)[:100]}")
+        log.warning(f"  ✗ Network error fetching from {source_name}: {str(e)[:100]}")
+    except XML_PARSE_ERRORS as e:
+        log.warning(f"  ✗ XML parse error from {source_name}: {str(e)[:100]}")
     except Exception as e:
-        print(f"  ✗ Error fetching from {source_name}: {str(e)[:100]}")
+        log.warning(f"  ✗ Error fetching from {source_name}: {str(e)[:100]}")
 
     return news_items
 
 
+def restore_news_item(cached_item: Dict, source_name: str) -> Dict:
+    """Rebuild a news item dict from its feed cache entry"""
+    pub_date = datetime.fromtimestamp(cached_item['timestamp'], timezone.utc)
+    return make_news_item(source_name, cached_item['title'], cached_item['link'], pub_date)
+
+
+def load_feed_cache(cache_file: str = FEED_CACHE_FILE) -> Dict[str, Any]:
+    """Load the per-feed conditional request cache"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_file_atomic(path: str, data: bytes):
+    """Write a file through a temporary file and os.replace(), so readers never see a partial file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def news_digest(news_items: List[Dict]) -> str:
+    """
+    Hash the source, title and link of every item, independent of their order
+
+    RENDER_FINGERPRINT is hashed in too, so the digest also changes when
+    the page templates or category rules do.
+    """
+    lines = sorted(f"{item['source']}\t{item['title']}\t{item['link']}" for item in news_items)
+    lines.append(RENDER_FINGERPRINT)
+    return hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+def read_previous_digest(digest_file: str = DIGEST_FILE) -> Optional[str]:
+    """Read the digest of the news rendered by the previous run, if any"""
+    try:
+        with open(digest_file, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def normalize_link(link: str) -> str:
+    """Reduce an article URL to a dedup key: no scheme, fragment, trailing slash or tracking params"""
+    parts = urlsplit(link.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ])
+    return urlunsplit(('', parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
+def title_signature(title: str) -> str:
+    """Lowercase a title and collapse punctuation/whitespace, so syndicated copies compare equal"""
+    return TITLE_SEPARATORS_RE.sub(' ', title.lower()).strip()
+
+
+def deduplicate_news(news_items: List[Dict]) -> List[Dict]:
+    """
+    Drop duplicate stories syndicated by several feeds
+
+    Items are duplicates when their links normalize to the same URL or
+    their titles have the same signature. The newest copy is kept, and
+    surviving items keep their original order.
+    """
+    seen_links = set()
+    seen_titles = set()
+    kept = set()
+
+    newest_first = sorted(range(len(news_items)), key=lambda i: news_items[i]['timestamp'], reverse=True)
+    for index in newest_first:
+        item = news_items[index]
+        link_key = normalize_link(item['link'])
+        title_key = title_signature(item['title'])
+
+        if link_key in seen_links or (title_key and title_key in seen_titles):
+            continue
+
+        seen_links.add(link_key)
+        if title_key:
+            seen_titles.add(title_key)
+        kept.add(index)
+
+    return [item for index, item in enumerate(news_items) if index in kept]
+
+
 def categorize_news(news_items: List[Dict]) -> Dict[str, List[Dict]]:
-    """Categorize news items by keywords"""
-    categorized = defaultdict(list)
-    uncategorized = []
+    """Categorize news items by keywords, each category sorted newest first"""
+    # Every category (and "General Tech News" for uncategorized items)
+    # starts with an empty list; empty ones are dropped at the end
+    categorized = {category: [] for category in CATEGORIES}
+    uncategorized = categorized["General Tech News"] = []
 
     for item in news_items:
-        title_lower = item['title'].lower()
-        matched = False
-
-        for category, keywords in TECH_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in title_lower:
-                    categorized[category].append(item)
-                    matched = True
+        # One pass over the title; the highest-priority category hit wins
+        best = None
+        for match in KEYWORD_PATTERN.finditer(item['title'].lower()):
+            priority = int(match.lastgroup[1:])
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
                     break
-            if matched:
-                break
 
-        if not matched:
+        if best is None:
             uncategorized.append(item)
+        else:
+            categorized[CATEGORIES[best]].append(item)
 
-    # Add uncategorized to "General Tech News"
-    if uncategorized:
-        categorized["General Tech News"] = uncategorized
-
-    return dict(categorized)
-
+    # Sort each category once, newest first, for every renderer to reuse
+    for items in categorized.values():
+        items.sort(key=itemgetter('timestamp'), reverse=True)
 
-def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
-    """Generate professional HTML from categorized news"""
+    return {category: items for category, items in categorized.items() if items}
 
-    # Count total news
-    total_news = sum(len(items) for items in categorized_news.values())
-    num_categories = len(categorized_news)
 
-    # Get current time
-    now = datetime.now(timezone.utc)
-    generation_time = now.strftime("%m-%d %H:%M UTC")
-
-    # Start HTML
-    html = f"""<!DOCTYPE html>
+# Static document head: meta tags, scripts and the page stylesheet
+HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -236,9 +526,9 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
     <title>SignalForge - Tech News Analysis</title>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js" integrity="sha512-BNaRQnYJYiPSqHHDb58B0yaPfCu+Wgds8Gp/gU33kqBtgNS4tSPHuGibyoeqMV/TJlSKda6FXzoEyYGjTe+vXA==" crossorigin="anonymous" referrerpolicy="no-referrer"></script>
     <style>
-        * {{ box-sizing: border-box; }}
+        * { box-sizing: border-box; }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', sans-serif;
             margin: 0;
             padding: 20px;
@@ -246,111 +536,111 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
             color: #333;
             line-height: 1.6;
             min-height: 100vh;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 900px;
             margin: 0 auto;
             background: white;
             border-radius: 16px;
             overflow: hidden;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
             color: white;
             padding: 40px 32px;
             position: relative;
-        }}
+        }
 
-        .header-title {{
+        .header-title {
             font-size: 32px;
             font-weight: 800;
             margin: 0 0 24px 0;
             letter-spacing: -0.5px;
-        }}
+        }
 
-        .header-subtitle {{
+        .header-subtitle {
             font-size: 16px;
             opacity: 0.9;
             margin-bottom: 24px;
             font-weight: 400;
-        }}
+        }
 
-        .header-stats {{
+        .header-stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 16px;
             margin-top: 20px;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: rgba(255, 255, 255, 0.15);
             backdrop-filter: blur(10px);
             padding: 16px;
             border-radius: 12px;
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 12px;
             opacity: 0.85;
             text-transform: uppercase;
             letter-spacing: 0.5px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 28px;
             font-weight: 700;
-        }}
+        }
 
-        .content {{
+        .content {
             padding: 32px;
-        }}
+        }
 
-        .category-section {{
+        .category-section {
             margin-bottom: 48px;
-        }}
+        }
 
-        .category-header {{
+        .category-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-bottom: 20px;
             padding-bottom: 12px;
             border-bottom: 3px solid #e5e7eb;
-        }}
+        }
 
-        .category-title {{
+        .category-title {
             font-size: 22px;
             font-weight: 700;
             color: #1e293b;
             display: flex;
             align-items: center;
             gap: 12px;
-        }}
+        }
 
-        .category-icon {{
+        .category-icon {
             font-size: 24px;
-        }}
+        }
 
-        .category-count {{
+        .category-count {
             background: #3b82f6;
             color: white;
             padding: 6px 14px;
             border-radius: 20px;
             font-size: 14px;
             font-weight: 600;
-        }}
+        }
 
-        .news-grid {{
+        .news-grid {
             display: grid;
             gap: 16px;
-        }}
+        }
 
-        .news-card {{
+        .news-card {
             background: #f8fafc;
             border: 1px solid #e2e8f0;
             border-radius: 12px;
@@ -358,9 +648,9 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
             transition: all 0.3s ease;
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .news-card::before {{
+        .news-card::before {
             content: '';
             position: absolute;
             left: 0;
@@ -370,28 +660,28 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
             background: linear-gradient(135deg, #3b82f6, #8b5cf6);
             opacity: 0;
             transition: opacity 0.3s ease;
-        }}
+        }
 
-        .news-card:hover {{
+        .news-card:hover {
             transform: translateX(4px);
             box-shadow: 0 8px 24px rgba(0,0,0,0.1);
             border-color: #3b82f6;
-        }}
+        }
 
-        .news-card:hover::before {{
+        .news-card:hover::before {
             opacity: 1;
-        }}
+        }
 
-        .news-header {{
+        .news-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-bottom: 12px;
             flex-wrap: wrap;
             gap: 8px;
-        }}
+        }
 
-        .news-source {{
+        .news-source {
             display: inline-flex;
             align-items: center;
             gap: 6px;
@@ -402,57 +692,57 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
             font-weight: 600;
             color: #3b82f6;
             border: 1px solid #dbeafe;
-        }}
+        }
 
-        .news-time {{
+        .news-time {
             color: #64748b;
             font-size: 13px;
-        }}
+        }
 
-        .news-title {{
+        .news-title {
             font-size: 16px;
             line-height: 1.5;
             margin: 0;
-        }}
+        }
 
-        .news-link {{
+        .news-link {
             color: #1e293b;
             text-decoration: none;
             font-weight: 500;
             transition: color 0.2s ease;
-        }}
+        }
 
-        .news-link:hover {{
+        .news-link:hover {
             color: #3b82f6;
             text-decoration: underline;
-        }}
+        }
 
-        .footer {{
+        .footer {
             background: #f1f5f9;
             padding: 32px;
             text-align: center;
             border-top: 1px solid #e2e8f0;
-        }}
+        }
 
-        .footer-content {{
+        .footer-content {
             font-size: 14px;
             color: #64748b;
             line-height: 1.8;
-        }}
+        }
 
-        .footer-link {{
+        .footer-link {
             color: #3b82f6;
             text-decoration: none;
             font-weight: 600;
             transition: color 0.2s ease;
-        }}
+        }
 
-        .footer-link:hover {{
+        .footer-link:hover {
             color: #1e40af;
             text-decoration: underline;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             background: #10b981;
             color: white;
@@ -462,19 +752,22 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
             font-weight: 700;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
-
-        @media (max-width: 768px) {{
-            body {{ padding: 12px; }}
-            .header {{ padding: 32px 24px; }}
-            .content {{ padding: 24px 20px; }}
-            .header-title {{ font-size: 26px; }}
-            .category-title {{ font-size: 18px; }}
-        }}
+        }
+
+        @media (max-width: 768px) {
+            body { padding: 12px; }
+            .header { padding: 32px 24px; }
+            .content { padding: 24px 20px; }
+            .header-title { font-size: 26px; }
+            .category-title { font-size: 18px; }
+        }
     </style>
 </head>
 <body>
-    <div class="container">
+"""
+
+# Page header with the summary stats, opening the content area
+HEADER_TEMPLATE = """    <div class="container">
         <div class="header">
             <div class="header-title">🚀 SignalForge Tech News</div>
             <div class="header-subtitle">Real-time aggregation from leading English tech publications</div>
@@ -482,15 +775,15 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
             <div class="header-stats">
                 <div class="stat-card">
                     <div class="stat-label">Total Articles</div>
-                    <div class="stat-value">{total_news}</div>
+                    <div class="stat-value">{total}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Categories</div>
-                    <div class="stat-value">{num_categories}</div>
+                    <div class="stat-value">{categories}</div>
                 </div>
                 <div class="stat-card">
                     <div class="stat-label">Last Updated</div>
-                    <div class="stat-value" style="font-size: 18px;">{generation_time}</div>
+                    <div class="stat-value" style="font-size: 18px;">{updated}</div>
                 </div>
             </div>
         </div>
@@ -498,6 +791,64 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
         <div class="content">
 """
 
+# Page footer, closing the content area and the document
+HTML_FOOTER = """
+        </div>
+
+        <div class="footer">
+            <div class="footer-content">
+                <strong>Powered by SignalForge</strong> 🔥<br>
+                An open-source tech news aggregator · Auto-updated every hour<br>
+                <a href="https://github.com/ruslanmv/SignalForge" target="_blank" rel="noopener noreferrer" class="footer-link">
+                    View on GitHub ⭐
+                </a>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# HTML for a single news card, filled from a news item dict (see make_news_item)
+CARD_TEMPLATE = """
+                    <div class="news-card">
+                        <div class="news-header">
+                            <span class="news-source">📡 {source_safe}</span>
+                            <span class="news-time">🕐 {time_str}</span>
+                        </div>
+                        <div class="news-title">
+                            <a href="{link_safe}" target="_blank" rel="noopener noreferrer" class="news-link">
+                                {title_safe}
+                            </a>
+                        </div>
+                    </div>
+"""
+
+# Everything besides the news that shapes the page: folded into the news
+# digest, so a template, style or category rule change forces a re-render
+RENDER_FINGERPRINT = hashlib.sha1(repr((
+    RENDER_VERSION, HTML_HEAD, HEADER_TEMPLATE, HTML_FOOTER, CARD_TEMPLATE,
+    CARD_TIME_FORMAT, TECH_KEYWORDS,
+)).encode('utf-8')).hexdigest()
+
+
+def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
+    """Generate professional HTML from categorized news"""
+
+    # Count total news
+    total_news = sum(len(items) for items in categorized_news.values())
+    num_categories = len(categorized_news)
+
+    # Get current time
+    now = datetime.now(timezone.utc)
+    generation_time = now.strftime("%m-%d %H:%M UTC")
+
+    # Start HTML
+    parts = [
+        HTML_HEAD,
+        HEADER_TEMPLATE.format(total=total_news, categories=num_categories, updated=generation_time)
+    ]
+
     # Category icons
     category_icons = {
         "AI & Machine Learning": "🤖",
@@ -517,7 +868,7 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
     for idx, (category, news_items) in enumerate(sorted_categories):
         icon = category_icons.get(category, "📌")
 
-        html += f"""
+        parts.append(f"""
             <div class="category-section">
                 <div class="category-header">
                     <div class="category-title">
@@ -528,88 +879,99 @@ def generate_html(categorized_news: Dict[str, List[Dict]]) -> str:
                 </div>
 
                 <div class="news-grid">
-"""
-
-        # Sort news items by timestamp (newest first)
-        sorted_news = sorted(news_items, key=lambda x: x['timestamp'], reverse=True)
+""")
 
-        # Add each news item
-        for news_idx, item in enumerate(sorted_news[:15]):  # Limit to 15 items per category
-            time_str = item['published'].strftime("%b %d, %H:%M UTC")
+        # Add each news item (categorize_news sorts them newest first)
+        for item in news_items[:15]:  # Limit to 15 items per category
+            parts.append(CARD_TEMPLATE.format_map(item))
 
-            html += f"""
-                    <div class="news-card">
-                        <div class="news-header">
-                            <span class="news-source">📡 {item['source']}</span>
-                            <span class="news-time">🕐 {time_str}</span>
-                        </div>
-                        <div class="news-title">
-                            <a href="{item['link']}" target="_blank" rel="noopener noreferrer" class="news-link">
-                                {item['title']}
-                            </a>
-                        </div>
-                    </div>
-"""
-
-        html += """
+        parts.append("""
                 </div>
             </div>
-"""
-
-    # Close HTML
-    html += f"""
-        </div>
+""")
 
-        <div class="footer">
-            <div class="footer-content">
-                <strong>Powered by SignalForge</strong> 🔥<br>
-                An open-source tech news aggregator · Auto-updated every hour<br>
-                <a href="https://github.com/ruslanmv/SignalForge" target="_blank" rel="noopener noreferrer" class="footer-link">
-                    View on GitHub ⭐
-                </a>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    parts.append(HTML_FOOTER)
 
-    return html
+    return ''.join(parts)
 
 
 def main():
     """Main function to fetch and generate news"""
-    print("🚀 SignalForge - Fetching English Tech News")
-    print("=" * 60)
+    # Progress goes through logging, which serializes lines written from
+    # the fetch threads (print() can interleave them)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+
+    log.info("🚀 SignalForge - Fetching English Tech News")
+    log.info("=" * 60)
 
     all_news = []
 
-    # Fetch from all sources
-    for source_name, feed_url in NEWS_SOURCES.items():
-        news_items = fetch_news_from_source(source_name, feed_url)
-        all_news.extend(news_items)
+    # Fetch all sources concurrently; the run takes as long as the slowest
+    # feed rather than the sum of all of them. Submission order is shuffled
+    # so feeds sharing a host/CDN are not all requested back to back.
+    sources = list(NEWS_SOURCES.items())
+    random.shuffle(sources)
+
+    news_by_source = {}
+    feed_cache = load_feed_cache()
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(sources)))) as executor:
+        futures = {
+            executor.submit(fetch_news_from_source, source_name, feed_url, feed_cache=feed_cache): source_name
+            for source_name, feed_url in sources
+        }
+        for future in as_completed(futures):
+            news_by_source[futures[future]] = future.result()
+
+    try:
+        write_file_atomic(FEED_CACHE_FILE, json.dumps(feed_cache, ensure_ascii=False).encode('utf-8'))
+    except OSError as e:
+        log.warning(f"Warning: Could not save feed cache: {e}")
+
+    # Keep the configured source order so the output does not depend on timing
+    for source_name in NEWS_SOURCES:
+        all_news.extend(news_by_source.get(source_name, []))
 
-    print(f"\n✓ Total news items fetched: {len(all_news)}")
+    log.info(f"\n✓ Total news items fetched: {len(all_news)}")
+
+    # Drop stories syndicated by more than one feed
+    unique_news = deduplicate_news(all_news)
+    if len(unique_news) < len(all_news):
+        log.info(f"  Removed {len(all_news) - len(unique_news)} duplicate items")
+    all_news = unique_news
+
+    # Nothing to do when the same stories were already rendered
+    output_file = "index.html"
+    digest = news_digest(all_news)
+    if digest == read_previous_digest() and os.path.exists(output_file):
+        log.info(f"\n✅ No changes since the last run, keeping {output_file}")
+        return
 
     # Categorize news
-    print("\n📊 Categorizing news...")
+    log.info("\n📊 Categorizing news...")
     categorized = categorize_news(all_news)
 
     for category, items in categorized.items():
-        print(f"  • {category}: {len(items)} items")
+        log.info(f"  • {category}: {len(items)} items")
 
     # Generate HTML
-    print("\n📝 Generating HTML...")
+    log.info("\n📝 Generating HTML...")
     html_content = generate_html(categorized)
 
-    # Save to index.html
-    output_file = "index.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Save to index.html, plus a pre-compressed copy for servers that can
+    # serve it directly; both are replaced atomically, so a failed run
+    # never leaves a half-written page behind
+    html_bytes = html_content.encode('utf-8')
+    write_file_atomic(output_file, html_bytes)
+    write_file_atomic(f"{output_file}.gz", gzip.compress(html_bytes, compresslevel=6, mtime=0))
+
+    try:
+        write_file_atomic(DIGEST_FILE, digest.encode('utf-8'))
+    except OSError as e:
+        log.warning(f"Warning: Could not save news digest: {e}")
 
-    print(f"\n✅ Successfully generated {output_file}")
-    print(f"   Total articles: {len(all_news)}")
-    print(f"   Categories: {len(categorized)}")
+    log.info(f"\n✅ Successfully generated {output_file}")
+    log.info(f"   Total articles: {len(all_news)}")
+    log.info(f"   Categories: {len(categorized)}")
 
 
 if __name__ == "__main__":
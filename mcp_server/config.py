@@ -8,15 +8,35 @@ variables into a single Settings object used by the MCP server.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 import os
 
 import yaml
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 DEFAULT_CONFIG_RELATIVE_PATH = "config/config.yaml"
 
 
+@lru_cache(maxsize=4)
+def _load_yaml(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, cached per path and modification time.
+
+    The modification time is part of the cache key so an edited file is
+    re-read. The returned dict is shared between callers; treat it as
+    read-only.
+    """
+    # PyYAML decodes the raw bytes itself (UTF-8 unless a BOM says otherwise)
+    return yaml.load(Path(path_str).read_bytes(), Loader=_YamlLoader) or {}
+
+
 @dataclass
 class Settings:
     """
@@ -27,12 +47,14 @@ class Settings:
         config: Parsed YAML configuration as a nested dict.
         environment: Logical environment name (e.g. "dev", "staging", "prod").
         log_level: Logging level string (DEBUG/INFO/WARNING/ERROR).
+        pretty_json: Indent tool responses for debugging (compact by default).
     """
 
     project_root: Path
     config: Dict[str, Any]
     environment: str = "production"
     log_level: str = "INFO"
+    pretty_json: bool = False
 
     @property
     def output_dir(self) -> Path:
@@ -74,8 +96,7 @@ class Settings:
         if not cfg_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {cfg_path}")
 
-        with cfg_path.open("r", encoding="utf-8") as f:
-            raw_cfg = yaml.safe_load(f) or {}
+        raw_cfg = _load_yaml(str(cfg_path), cfg_path.stat().st_mtime_ns)
 
         # Environment and log level
         environment = os.getenv("SIGNALFORGE_ENV", "production")
@@ -85,9 +106,12 @@ class Settings:
             or (raw_cfg.get("logging", {}) or {}).get("level", "INFO")
         )
 
+        pretty_json = os.getenv("SIGNALFORGE_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
         return cls(
             project_root=root,
             config=raw_cfg,
             environment=environment,
             log_level=log_level,
+            pretty_json=pretty_json,
         )
@@ -5,63 +5,212 @@ Production-grade MCP tool server using FastMCP 2.0.
 Supports both stdio and HTTP transport modes.
 """
 
+import functools
+import importlib
 import json
 import logging
+import sys
+import threading
+import time
 from typing import List, Optional, Dict
 
+import anyio
 from fastmcp import FastMCP
 
 from . import __version__
 from .config import Settings
 from .logging_config import setup_logging
-from .tools.data_query import DataQueryTools
-from .tools.analytics import AnalyticsTools
-from .tools.search_tools import SearchTools
-from .tools.config_mgmt import ConfigManagementTools
-from .tools.system import SystemManagementTools
+from .services.cache_service import CacheService
+
+try:
+    # orjson is optional: it serializes large news lists several times faster
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
+# Logging on per-call paths (tool handlers and the helpers they use) must be
+# guarded with `if logger.isEnabledFor(logging.DEBUG):` so disabled tracing
+# costs a single level check, not argument evaluation and a logger call.
+
+# Stdlib encoders used when orjson is not installed. Binding them once skips
+# the keyword handling and encoder construction json.dumps does per call;
+# tool results are plain trees of dicts/lists, so the circular check is off.
+_COMPACT_ENCODE = json.JSONEncoder(
+    ensure_ascii=False, separators=(',', ':'), check_circular=False
+).encode
+_PRETTY_ENCODE = json.JSONEncoder(
+    ensure_ascii=False, indent=2, check_circular=False
+).encode
 
 # Create FastMCP 2.0 application
 mcp = FastMCP('signalforge')
 
-# Global settings and tool instances (initialized on first request)
-_settings: Optional[Settings] = None
-_tools_instances: Dict[str, object] = {}
+# Tool namespace -> (module under mcp_server.tools, class name)
+_TOOL_CLASSES = {
+    "data": ("data_query", "DataQueryTools"),
+    "analytics": ("analytics", "AnalyticsTools"),
+    "search": ("search_tools", "SearchTools"),
+    "config": ("config_mgmt", "ConfigManagementTools"),
+    "system": ("system", "SystemManagementTools"),
+}
+
+
+class _LazyTools:
+    """
+    Tool instances by namespace (tools.data, tools.analytics, ...).
+
+    Each tool class is imported and created on first access. Until then its
+    slot is empty, so attribute lookup falls through to __getattr__; after
+    that, access is a plain slot load.
+    """
+
+    __slots__ = ("_project_root",) + tuple(_TOOL_CLASSES)
+
+    def __init__(self, project_root: str):
+        self._project_root = project_root
+
+    def __getattr__(self, name: str) -> object:
+        try:
+            module_name, class_name = _TOOL_CLASSES[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        with _init_lock:
+            try:
+                # Another thread may have filled the slot while we waited
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+            module = importlib.import_module(f".tools.{module_name}", __package__)
+            instance = getattr(module, class_name)(self._project_root)
+            setattr(self, name, instance)
+            return instance
+
+
+class _ServerState:
+    """Settings and tool instances of the running server (set on first request)."""
+
+    __slots__ = ("settings", "tools")
+
+    def __init__(self):
+        self.settings: Optional[Settings] = None
+        self.tools: Optional[_LazyTools] = None
+
+
+_STATE = _ServerState()
+# Guards the one-time creation of _STATE.settings, _STATE.tools and each tool
+_init_lock = threading.Lock()
+
+# Serialized responses of read-only tools, so repeated calls (client retries,
+# multi-turn planning) skip both the tool call and JSON encoding
+_response_cache = CacheService()
+CONFIG_RESPONSE_TTL = 60  # seconds
+STATUS_RESPONSE_TTL = 10  # seconds
+
+
+# Tool methods are blocking (file I/O, crawling, analysis), so handlers run
+# them in anyio worker threads to keep the event loop free for concurrent
+# calls. The expensive namespaces get their own capacity limiter, so a burst
+# of e.g. analytics calls cannot take every worker thread and stall the cheap
+# tools or the stdio reader. Other calls share anyio's default limiter.
+_LIMITERS = {
+    "analytics": anyio.CapacityLimiter(4),
+    "search": anyio.CapacityLimiter(8),
+    "crawl": anyio.CapacityLimiter(2),
+}
+
+
+async def _run_in_thread(func, /, *args, limiter: Optional[str] = None, **kwargs):
+    """Run a blocking tool method in a worker thread, bounded by the named limiter."""
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs),
+        limiter=_LIMITERS[limiter] if limiter else None,
+    )
+
+
+def _call_and_dump(func, /, *args, **kwargs) -> str:
+    """
+    Call a tool method and serialize its result in the same worker thread.
+
+    Used by the tools with large or nested results (news lists, analytics
+    reports), so encoding them does not block the event loop and several
+    responses can be encoded at once.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return _dumps(func(*args, **kwargs))
+
+    start = time.perf_counter()
+    response = _dumps(func(*args, **kwargs))
+    logger.debug(
+        "%s returned %d chars in %.1f ms",
+        func.__qualname__, len(response), (time.perf_counter() - start) * 1000,
+    )
+    return response
 
 
 def _init_settings(project_root: Optional[str] = None) -> Settings:
     """Load configuration and initialize logging once."""
-    global _settings
-    if _settings is None:
-        settings = Settings.load(project_root=project_root)
-        setup_logging(settings.log_level)
-        logger.info(
-            "SignalForge MCP server initialized (env=%s, root=%s, version=%s)",
-            settings.environment,
-            settings.project_root,
-            __version__,
-        )
-        _settings = settings
-    return _settings
-
+    if _STATE.settings is None:
+        with _init_lock:
+            if _STATE.settings is None:
+                settings = Settings.load(project_root=project_root)
+                setup_logging(settings.log_level)
+                logger.info(
+                    "SignalForge MCP server initialized (env=%s, root=%s, version=%s)",
+                    settings.environment,
+                    settings.project_root,
+                    __version__,
+                )
+                _STATE.settings = settings
+    return _STATE.settings
+
+
+def _get_tools(project_root: Optional[str] = None) -> _LazyTools:
+    """
+    Get the tool instances (singleton style).
 
-def _get_tools(project_root: Optional[str] = None) -> Dict[str, object]:
-    """Get or create tool instances (singleton style)."""
+    A tool class is only imported and instantiated when its namespace is
+    first looked up, so a session that only calls get_system_status never
+    loads the analytics or search tools.
+    """
     settings = _init_settings(project_root)
-    if not _tools_instances:
-        root = str(settings.project_root)
-        _tools_instances["data"] = DataQueryTools(root)
-        _tools_instances["analytics"] = AnalyticsTools(root)
-        _tools_instances["search"] = SearchTools(root)
-        _tools_instances["config"] = ConfigManagementTools(root)
-        _tools_instances["system"] = SystemManagementTools(root)
-    return _tools_instances
+    if _STATE.tools is None:
+        with _init_lock:
+            if _STATE.tools is None:
+                _STATE.tools = _LazyTools(str(settings.project_root))
+    return _STATE.tools
+
+
+# Tools are registered with output_schema=None: their JSON text is the whole
+# response. With the inferred `-> str` schema FastMCP would send the payload a
+# second time, escaped into structuredContent as {"result": "..."}.
+#
+# FastMCP (2.12/2.13) dispatches tools/call in-process: middleware chain ->
+# ToolManager.call_tool -> argument validation -> the handler coroutine, with
+# no internal client or HTTP round trip. Keep it that way when upgrading; the
+# pin in requirements.txt is what guards it.
+
+def _dumps(result) -> str:
+    """
+    Serialize a tool result to JSON, using orjson when it is available.
+
+    Output is compact: clients parse it rather than display it. Set
+    SIGNALFORGE_PRETTY_JSON=1 to indent it while debugging.
+    """
+    pretty = _STATE.settings is not None and _STATE.settings.pretty_json
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(result, option=option).decode('utf-8')
+    if pretty:
+        return _PRETTY_ENCODE(result)
+    return _COMPACT_ENCODE(result)
 
 
 # ==================== Data Query Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_latest_news(
     platforms: Optional[List[str]] = None,
     limit: int = 50,
@@ -95,11 +244,13 @@ async def get_latest_news(
     **Note**: If the user asks "why is only part shown", it means they need the complete data
     """
     tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_in_thread(
+        _call_and_dump, tools.data.get_latest_news,
+        platforms=platforms, limit=limit, include_url=include_url
+    )
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_trending_topics(
     top_n: int = 10,
     mode: str = 'current'
@@ -121,11 +272,11 @@ async def get_trending_topics(
         JSON-formatted list of keyword frequency statistics
     """
     tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_in_thread(tools.data.get_trending_topics, top_n=top_n, mode=mode)
+    return _dumps(result)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_news_by_date(
     date_query: Optional[str] = None,
     platforms: Optional[List[str]] = None,
@@ -164,19 +315,19 @@ async def get_news_by_date(
     **Note**: If the user asks "why is only part shown", it means they need the complete data
     """
     tools = _get_tools()
-    result = tools['data'].get_news_by_date(
+    return await _run_in_thread(
+        _call_and_dump, tools.data.get_news_by_date,
         date_query=date_query,
         platforms=platforms,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 
 # ==================== Advanced Analytics Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def analyze_topic_trend(
     topic: str,
     analysis_type: str = "trend",
@@ -229,7 +380,8 @@ async def analyze_topic_trend(
         - analyze_topic_trend(topic="ChatGPT", analysis_type="predict", lookahead_hours=6)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    return await _run_in_thread(
+        _call_and_dump, tools.analytics.analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -237,12 +389,12 @@ async def analyze_topic_trend(
         threshold=threshold,
         time_window=time_window,
         lookahead_hours=lookahead_hours,
-        confidence_threshold=confidence_threshold
+        confidence_threshold=confidence_threshold,
+        limiter="analytics",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def analyze_data_insights(
     insight_type: str = "platform_compare",
     topic: Optional[str] = None,
@@ -275,17 +427,18 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    return await _run_in_thread(
+        _call_and_dump, tools.analytics.analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
-        top_n=top_n
+        top_n=top_n,
+        limiter="analytics",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def analyze_sentiment(
     topic: Optional[str] = None,
     platforms: Optional[List[str]] = None,
@@ -322,18 +475,19 @@ async def analyze_sentiment(
     - Only filter when user explicitly requests "summary" or "highlights"
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    return await _run_in_thread(
+        _call_and_dump, tools.analytics.analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
         limit=limit,
         sort_by_weight=sort_by_weight,
-        include_url=include_url
+        include_url=include_url,
+        limiter="analytics",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def find_similar_news(
     reference_title: str,
     threshold: float = 0.6,
@@ -360,16 +514,17 @@ async def find_similar_news(
     - Only filter when user explicitly requests "summary" or "highlights"
     """
     tools = _get_tools()
-    result = tools['analytics'].find_similar_news(
+    return await _run_in_thread(
+        _call_and_dump, tools.analytics.find_similar_news,
         reference_title=reference_title,
         threshold=threshold,
         limit=limit,
-        include_url=include_url
+        include_url=include_url,
+        limiter="analytics",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def generate_summary_report(
     report_type: str = "daily",
     date_range: Optional[Dict[str, str]] = None
@@ -388,16 +543,17 @@ async def generate_summary_report(
         JSON-formatted summary report with Markdown content
     """
     tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    return await _run_in_thread(
+        _call_and_dump, tools.analytics.generate_summary_report,
         report_type=report_type,
-        date_range=date_range
+        date_range=date_range,
+        limiter="analytics",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== Intelligent Search Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def search_news(
     query: str,
     search_mode: str = "keyword",
@@ -467,7 +623,8 @@ async def search_news(
         - Fuzzy search: search_news(query="Tesla price cut", search_mode="fuzzy", threshold=0.4)
     """
     tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    return await _run_in_thread(
+        _call_and_dump, tools.search.search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -475,12 +632,12 @@ async def search_news(
         limit=limit,
         sort_by=sort_by,
         threshold=threshold,
-        include_url=include_url
+        include_url=include_url,
+        limiter="search",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def search_related_news_history(
     reference_text: str,
     time_preset: str = "yesterday",
@@ -514,19 +671,20 @@ async def search_related_news_history(
     - Only filter when user explicitly requests "summary" or "highlights"
     """
     tools = _get_tools()
-    result = tools['search'].search_related_news_history(
+    return await _run_in_thread(
+        _call_and_dump, tools.search.search_related_news_history,
         reference_text=reference_text,
         time_preset=time_preset,
         threshold=threshold,
         limit=limit,
-        include_url=include_url
+        include_url=include_url,
+        limiter="search",
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== Configuration and System Management Tools ====================
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_current_config(
     section: str = "all"
 ) -> str:
@@ -544,12 +702,20 @@ async def get_current_config(
     Returns:
         JSON-formatted configuration information
     """
+    cache_key = f"get_current_config:{section}"
+    cached = _response_cache.get(cache_key, ttl=CONFIG_RESPONSE_TTL)
+    if cached is not None:
+        return cached
+
     tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_in_thread(tools.config.get_current_config, section=section)
+    response = _dumps(result)
+    if result.get('success'):
+        _response_cache.set(cache_key, response)
+    return response
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def get_system_status() -> str:
     """
     Get system runtime status and health check information
@@ -559,12 +725,19 @@ async def get_system_status() -> str:
     Returns:
         JSON-formatted system status information
     """
+    cached = _response_cache.get("get_system_status", ttl=STATUS_RESPONSE_TTL)
+    if cached is not None:
+        return cached
+
     tools = _get_tools()
-    result = tools['system'].get_system_status()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_in_thread(tools.system.get_system_status)
+    response = _dumps(result)
+    if result.get('success'):
+        _response_cache.set("get_system_status", response)
+    return response
 
 
-@mcp.tool
+@mcp.tool(output_schema=None)
 async def trigger_crawl(
     platforms: Optional[List[str]] = None,
     save_to_local: bool = False,
@@ -595,12 +768,64 @@ async def trigger_crawl(
         - Use default platforms: trigger_crawl()  # Crawls all platforms configured in config.yaml
     """
     tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    response = await _run_in_thread(
+        _call_and_dump, tools.system.trigger_crawl,
+        platforms=platforms, save_to_local=save_to_local, include_url=include_url,
+        limiter="crawl",
+    )
+    # A crawl can change the data statistics reported by get_system_status
+    _response_cache.delete("get_system_status")
+    return response
 
 
 # ==================== Server Entry Point ====================
 
+# Startup banner, built once at import; run_server fills in the per-run fields
+_BANNER_TEMPLATE = f"""
+{'=' * 60}
+  SignalForge MCP Server - FastMCP 2.0
+{'=' * 60}
+  Version     : {__version__}
+  Environment : {{environment}}
+  Transport   : {{transport}}
+{{transport_info}}  Project Root: {{project_root}}
+
+  Registered Tools:
+    === Core Data Query (P0) ===
+    1. get_latest_news        - Get latest news
+    2. get_news_by_date       - Query news by date (supports natural language)
+    3. get_trending_topics    - Get trending topics
+
+    === Intelligent Search ===
+    4. search_news                  - Unified news search (keyword/fuzzy/entity)
+    5. search_related_news_history  - Historical related news search
+
+    === Advanced Analytics ===
+    6. analyze_topic_trend      - Unified topic trend analysis (trend/lifecycle/viral/predict)
+    7. analyze_data_insights    - Unified data insights (platform compare/activity/keyword co-occur)
+    8. analyze_sentiment        - Sentiment analysis
+    9. find_similar_news        - Find similar news
+    10. generate_summary_report - Daily/weekly summary generation
+
+    === Configuration & System Management ===
+    11. get_current_config      - Get current system configuration
+    12. get_system_status       - Get system runtime status
+    13. trigger_crawl           - Manually trigger crawl task
+{'=' * 60}
+
+"""
+
+_STDIO_BANNER_INFO = (
+    "  Protocol    : MCP over stdio (standard input/output)\n"
+    "  Description : Communicate with MCP clients via stdio\n"
+)
+_HTTP_BANNER_INFO = (
+    "  Listen Addr : http://{host}:{port}\n"
+    "  HTTP Path   : http://{host}:{port}/mcp\n"
+    "  Protocol    : MCP over HTTP (production mode)\n"
+)
+
+
 def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
@@ -616,56 +841,23 @@ def run_server(
         host: HTTP mode listening address, default 0.0.0.0
         port: HTTP mode listening port, default 3333
     """
-    # Initialize settings and tool instances
+    # Initialize settings (tool instances are created on first use)
     settings = _init_settings(project_root)
-    _get_tools(str(settings.project_root))
-
-    # Print startup information
-    print()
-    print("=" * 60)
-    print("  SignalForge MCP Server - FastMCP 2.0")
-    print("=" * 60)
-    print(f"  Version     : {__version__}")
-    print(f"  Environment : {settings.environment}")
-    print(f"  Transport   : {transport.upper()}")
 
+    # Print startup information in one write
     if transport == 'stdio':
-        print("  Protocol    : MCP over stdio (standard input/output)")
-        print("  Description : Communicate with MCP clients via stdio")
+        transport_info = _STDIO_BANNER_INFO
     elif transport == 'http':
-        print(f"  Listen Addr : http://{host}:{port}")
-        print(f"  HTTP Path   : http://{host}:{port}/mcp")
-        print("  Protocol    : MCP over HTTP (production mode)")
-
-    if project_root:
-        print(f"  Project Root: {project_root}")
+        transport_info = _HTTP_BANNER_INFO.format(host=host, port=port)
     else:
-        print("  Project Root: Current directory")
-
-    print()
-    print("  Registered Tools:")
-    print("    === Core Data Query (P0) ===")
-    print("    1. get_latest_news        - Get latest news")
-    print("    2. get_news_by_date       - Query news by date (supports natural language)")
-    print("    3. get_trending_topics    - Get trending topics")
-    print()
-    print("    === Intelligent Search ===")
-    print("    4. search_news                  - Unified news search (keyword/fuzzy/entity)")
-    print("    5. search_related_news_history  - Historical related news search")
-    print()
-    print("    === Advanced Analytics ===")
-    print("    6. analyze_topic_trend      - Unified topic trend analysis (trend/lifecycle/viral/predict)")
-    print("    7. analyze_data_insights    - Unified data insights (platform compare/activity/keyword co-occur)")
-    print("    8. analyze_sentiment        - Sentiment analysis")
-    print("    9. find_similar_news        - Find similar news")
-    print("    10. generate_summary_report - Daily/weekly summary generation")
-    print()
-    print("    === Configuration & System Management ===")
-    print("    11. get_current_config      - Get current system configuration")
-    print("    12. get_system_status       - Get system runtime status")
-    print("    13. trigger_crawl           - Manually trigger crawl task")
-    print("=" * 60)
-    print()
+        transport_info = ""
+
+    sys.stdout.write(_BANNER_TEMPLATE.format(
+        environment=settings.environment,
+        transport=transport.upper(),
+        transport_info=transport_info,
+        project_root=project_root or "Current directory",
+    ))
 
     # Run server based on transport mode
     if transport == 'stdio':
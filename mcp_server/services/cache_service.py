@@ -4,19 +4,53 @@ Cache Service
 Implements a TTL (Time-To-Live) caching mechanism to enhance data access performance.
 """
 
+import heapq
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Optional
 from threading import Lock
 
 
+class _Shard:
+    """One independently locked slice of a CacheService"""
+
+    __slots__ = ("cache", "expiry_heap", "lock", "key_locks")
+
+    def __init__(self):
+        # key -> (value, timestamp), kept in LRU order: least recently used first
+        self.cache = OrderedDict()
+        # (timestamp, key) min-heap in insertion-time order, so expired
+        # entries can be popped oldest first. Entries whose key was since
+        # deleted or re-set are stale and skipped (lazy deletion).
+        self.expiry_heap = []
+        self.lock = Lock()
+        # Per-key locks held while get_or_compute fills a missing entry
+        self.key_locks = {}
+
+
 class CacheService:
     """Cache service class"""
 
-    def __init__(self):
-        """Initialize the cache service"""
-        self._cache = {}
-        self._timestamps = {}
-        self._lock = Lock()
+    def __init__(self, max_entries: int = 1024, num_shards: int = 16):
+        """
+        Initialize the cache service
+
+        Keys are spread over independently locked shards, so concurrent
+        tool calls touching different keys do not wait on one global lock.
+
+        Args:
+            max_entries: Maximum number of entries; the least recently used
+                entry of a shard is evicted when a new key would exceed the
+                shard's share of it
+            num_shards: Number of shards
+        """
+        self.max_entries = max_entries
+        self._shard_capacity = max(1, max_entries // num_shards)
+        self._shards = [_Shard() for _ in range(num_shards)]
+
+    def _shard(self, key: str) -> _Shard:
+        """Return the shard holding key"""
+        return self._shards[hash(key) % len(self._shards)]
 
     def get(self, key: str, ttl: int = 900) -> Optional[Any]:
         """
@@ -29,15 +63,18 @@ class CacheService:
         Returns:
             Cached value, or None if it doesn't exist or has expired
         """
-        with self._lock:
-            if key in self._cache:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.cache.get(key)
+            if entry is not None:
+                value, timestamp = entry
                 # Check if expired
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
+                if time.time() - timestamp < ttl:
+                    shard.cache.move_to_end(key)
+                    return value
                 else:
                     # Expired, delete cache
-                    del self._cache[key]
-                    del self._timestamps[key]
+                    del shard.cache[key]
         return None
 
     def set(self, key: str, value: Any) -> None:
@@ -48,9 +85,59 @@ class CacheService:
             key: Cache key
             value: Cache value
         """
-        with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+        shard = self._shard(key)
+        with shard.lock:
+            timestamp = time.time()
+            shard.cache[key] = (value, timestamp)
+            shard.cache.move_to_end(key)
+            heapq.heappush(shard.expiry_heap, (timestamp, key))
+
+            # Evict the least recently used entry when over capacity
+            if len(shard.cache) > self._shard_capacity:
+                shard.cache.popitem(last=False)
+
+            # Rebuild the heap once stale entries dominate it
+            if len(shard.expiry_heap) > 2 * len(shard.cache) + 64:
+                shard.expiry_heap = [(ts, k) for k, (_, ts) in shard.cache.items()]
+                heapq.heapify(shard.expiry_heap)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: int = 900) -> Any:
+        """
+        Retrieve cached data, computing and caching it on a miss
+
+        Concurrent callers missing the same key wait for the first one to
+        compute the value instead of all computing it (cache stampede).
+        Exceptions from compute propagate and nothing is cached.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value
+            ttl: Time to live (seconds), default is 15 minutes
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, ttl)
+        if value is not None:
+            return value
+
+        shard = self._shard(key)
+        with shard.lock:
+            key_lock = shard.key_locks.setdefault(key, Lock())
+
+        try:
+            with key_lock:
+                # Another caller may have filled the entry while we waited
+                value = self.get(key, ttl)
+                if value is None:
+                    value = compute()
+                    self.set(key, value)
+        finally:
+            with shard.lock:
+                if shard.key_locks.get(key) is key_lock and not key_lock.locked():
+                    del shard.key_locks[key]
+
+        return value
 
     def delete(self, key: str) -> bool:
         """
@@ -62,18 +149,18 @@ class CacheService:
         Returns:
             Whether the deletion was successful
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+        shard = self._shard(key)
+        with shard.lock:
+            if shard.cache.pop(key, None) is not None:
                 return True
         return False
 
     def clear(self) -> None:
         """Clear all cache"""
-        with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.cache.clear()
+                shard.expiry_heap.clear()
 
     def cleanup_expired(self, ttl: int = 900) -> int:
         """
@@ -85,18 +172,23 @@ class CacheService:
         Returns:
             Number of entries cleaned
         """
-        with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
+        cutoff = time.time() - ttl
+        cleaned = 0
+
+        for shard in self._shards:
+            with shard.lock:
+                heap = shard.expiry_heap
 
-            for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                # Pop entries oldest first; only the expired ones are visited
+                while heap and heap[0][0] <= cutoff:
+                    timestamp, key = heapq.heappop(heap)
+                    entry = shard.cache.get(key)
+                    if entry is None or entry[1] != timestamp:
+                        continue  # Stale: key was deleted or set again later
+                    del shard.cache[key]
+                    cleaned += 1
 
-            return len(expired_keys)
+        return cleaned
 
     def get_stats(self) -> dict:
         """
@@ -105,22 +197,32 @@ class CacheService:
         Returns:
             Dictionary of statistics
         """
-        with self._lock:
-            return {
-                "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
-            }
+        total_entries = 0
+        oldest = None
+        newest = None
+
+        for shard in self._shards:
+            with shard.lock:
+                if not shard.cache:
+                    continue
+                total_entries += len(shard.cache)
+                timestamps = [timestamp for _, timestamp in shard.cache.values()]
+                shard_oldest = min(timestamps)
+                shard_newest = max(timestamps)
+            oldest = shard_oldest if oldest is None else min(oldest, shard_oldest)
+            newest = shard_newest if newest is None else max(newest, shard_newest)
+
+        now = time.time()
+        return {
+            "total_entries": total_entries,
+            "oldest_entry_age": now - oldest if oldest is not None else 0,
+            "newest_entry_age": now - newest if newest is not None else 0
+        }
 
 
 # Global cache instance
 _global_cache = None
+_global_cache_lock = Lock()
 
 
 def get_cache() -> CacheService:
@@ -132,5 +234,8 @@ def get_cache() -> CacheService:
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = CacheService()
-    return _global_cache
\ No newline at end of file
+        # Double-checked so concurrent first callers share one instance
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = CacheService()
+    return _global_cache
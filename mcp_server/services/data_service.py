@@ -4,16 +4,93 @@ Data Access Service
 Provides a unified data query interface and encapsulates data access logic.
 """
 
+import heapq
+import os
 import re
-from collections import Counter
+import threading
+import time
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .cache_service import get_cache
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
 
 
+# Age (seconds) after which get_system_status refreshes the storage scan
+# in the background while still serving the previous result
+STORAGE_REFRESH_INTERVAL = 60
+
+# Held while a background storage scan runs, so only one runs at a time
+_storage_refresh_lock = threading.Lock()
+
+# Date folder names, format: YYYY年MM月DD日
+DATE_FOLDER_RE = re.compile(r'(\d{4})年(\d{2})月(\d{2})日')
+
+
+def _parse_date_folder(name: str) -> Optional[datetime]:
+    """Return the date of a YYYY年MM月DD日 folder name, or None"""
+    date_match = DATE_FOLDER_RE.match(name)
+    if not date_match:
+        return None
+    try:
+        return datetime(
+            int(date_match.group(1)),
+            int(date_match.group(2)),
+            int(date_match.group(3))
+        )
+    except ValueError:
+        # Well-formed but not a calendar date, e.g. 2025年02月30日
+        return None
+
+
+@lru_cache(maxsize=8)
+def _keyword_matcher(words: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Compile one alternation matching any of the given watchlist words.
+
+    A single search with it rejects a title containing none of the words,
+    instead of one substring scan per word.
+    """
+    return re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+
+
+def _dir_size(path) -> int:
+    """
+    Total size in bytes of the regular files under path.
+
+    Walks with os.scandir, whose entries carry the file type from the
+    directory listing and cache their stat result.
+    """
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _dir_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _rank_candidates(all_titles: Dict) -> Iterator[Tuple]:
+    """
+    Yield parsed titles as (rank, seq, platform_id, title, info) tuples.
+
+    rank is the first recorded rank (0 if none). Tuples compare natively,
+    and the unique seq means ties never fall through to comparing the
+    info dicts while keeping equal ranks in reading order. Being lazy,
+    heapq.nsmallest over it only keeps limit tuples alive at a time.
+    """
+    seq = 0
+    for platform_id, titles in all_titles.items():
+        for title, info in titles.items():
+            ranks = info["ranks"]
+            yield (ranks[0] if ranks else 0, seq, platform_id, title, info)
+            seq += 1
+
+
 class DataService:
     """Data access service class"""
 
@@ -47,12 +124,23 @@ class DataService:
         Raises:
             DataNotFoundError: If data does not exist.
         """
-        # Try to get from cache
-        cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15 minutes cache
-        if cached:
-            return cached
+        # Try to get from cache; the output watermark in the key makes newly
+        # crawled data miss entries cached before it arrived
+        mtime = self.parser.latest_output_mtime()
+        cache_key = f"latest_news:{mtime}:{','.join(platforms or [])}:{limit}:{include_url}"
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._build_latest_news(platforms, limit, include_url),
+            ttl=900  # 15 minutes cache
+        )
 
+    def _build_latest_news(
+        self,
+        platforms: Optional[List[str]],
+        limit: int,
+        include_url: bool
+    ) -> List[Dict]:
+        """Build the get_latest_news result (uncached)"""
         # Read today's data
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=None,
@@ -66,40 +154,30 @@ class DataService:
         else:
             fetch_time = datetime.now()
 
-        # Convert to news list
-        news_list = []
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # Take the first rank
-                rank = info["ranks"][0] if info["ranks"] else 0
-
-                news_item = {
-                    "title": title,
-                    "platform": platform_id,
-                    "platform_name": platform_name,
-                    "rank": rank,
-                    "timestamp": fetch_time.strftime("%Y-%m-%d %H:%M:%S")
-                }
+        # Select the top limit lightweight (rank, seq, platform_id, title,
+        # info) tuples and only build dicts for those; seq keeps equal ranks
+        # in reading order
+        top_candidates = heapq.nsmallest(limit, _rank_candidates(all_titles))
 
-                # Conditionally add URL fields
-                if include_url:
-                    news_item["url"] = info.get("url", "")
-                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                news_list.append(news_item)
+        fetch_time_str = fetch_time.strftime("%Y-%m-%d %H:%M:%S")
+        news_list = []
+        for rank, _, platform_id, title, info in top_candidates:
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "rank": rank,
+                "timestamp": fetch_time_str
+            }
 
-        # Sort by rank
-        news_list.sort(key=lambda x: x["rank"])
+            # Conditionally add URL fields
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-        # Limit the returned quantity
-        result = news_list[:limit]
+            news_list.append(news_item)
 
-        # Cache the result
-        self.cache.set(cache_key, result)
-
-        return result
+        return news_list
 
     def get_news_by_date(
         self,
@@ -133,53 +211,52 @@ class DataService:
         """
         # Try to get from cache
         date_str = target_date.strftime("%Y-%m-%d")
-        cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30 minutes cache
-        if cached:
-            return cached
+        mtime = self.parser.latest_output_mtime(target_date)
+        cache_key = f"news_by_date:{date_str}:{mtime}:{','.join(platforms or [])}:{limit}:{include_url}"
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._build_news_by_date(target_date, date_str, platforms, limit, include_url),
+            ttl=1800  # 30 minutes cache
+        )
 
+    def _build_news_by_date(
+        self,
+        target_date: datetime,
+        date_str: str,
+        platforms: Optional[List[str]],
+        limit: int,
+        include_url: bool
+    ) -> List[Dict]:
+        """Build the get_news_by_date result (uncached)"""
         # Read data for the specified date
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=target_date,
             platform_ids=platforms
         )
 
-        # Convert to news list
-        news_list = []
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # Calculate average rank
-                avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                news_item = {
-                    "title": title,
-                    "platform": platform_id,
-                    "platform_name": platform_name,
-                    "rank": info["ranks"][0] if info["ranks"] else 0,
-                    "avg_rank": round(avg_rank, 2),
-                    "count": len(info["ranks"]),
-                    "date": date_str
-                }
-
-                # Conditionally add URL fields
-                if include_url:
-                    news_item["url"] = info.get("url", "")
-                    news_item["mobileUrl"] = info.get("mobileUrl", "")
+        # Select the top limit by rank, then only build dicts for those
+        top_candidates = heapq.nsmallest(limit, _rank_candidates(all_titles))
 
-                news_list.append(news_item)
-
-        # Sort by rank
-        news_list.sort(key=lambda x: x["rank"])
+        news_list = []
+        for rank, _, platform_id, title, info in top_candidates:
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "rank": rank,
+                "avg_rank": round(info["avg_rank"], 2),
+                "count": info["count"],
+                "date": date_str
+            }
 
-        # Limit the returned quantity
-        result = news_list[:limit]
+            # Conditionally add URL fields
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-        # Cache the result (historical data cached longer)
-        self.cache.set(cache_key, result)
+            news_list.append(news_item)
 
-        return result
+        return news_list
 
     def search_news_by_keyword(
         self,
@@ -213,6 +290,13 @@ class DataService:
         # Collect all matching news
         results = []
         platform_distribution = Counter()
+        # Running totals for the overall average rank
+        rank_sum = 0
+        rank_count = 0
+
+        # Compiled once; a case-insensitive search avoids lowercasing
+        # every title
+        keyword_pattern = re.compile(re.escape(keyword), re.IGNORECASE)
 
         # Iterate through date range
         current_date = start_date
@@ -223,25 +307,28 @@ class DataService:
                     platform_ids=platforms
                 )
 
+                date_str = current_date.strftime("%Y-%m-%d")
+
                 # Search for titles containing the keyword
                 for platform_id, titles in all_titles.items():
                     platform_name = id_to_name.get(platform_id, platform_id)
 
                     for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # Calculate average rank
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+                        if keyword_pattern.search(title):
+                            # Rank totals are precomputed by the parser
+                            rank_sum += info["rank_sum"]
+                            rank_count += info["count"]
 
                             results.append({
                                 "title": title,
                                 "platform": platform_id,
                                 "platform_name": platform_name,
                                 "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
+                                "count": info["count"],
+                                "avg_rank": round(info["avg_rank"], 2),
                                 "url": info.get("url", ""),
                                 "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
+                                "date": date_str
                             })
 
                             platform_distribution[platform_id] += 1
@@ -260,11 +347,7 @@ class DataService:
             )
 
         # Calculate statistics
-        total_ranks = []
-        for item in results:
-            total_ranks.extend(item["ranks"])
-
-        avg_rank = sum(total_ranks) / len(total_ranks) if total_ranks else 0
+        avg_rank = rank_sum / rank_count if rank_count else 0
 
         # Limit returned quantity (if specified)
         total_found = len(results)
@@ -305,13 +388,18 @@ class DataService:
             DataNotFoundError: If data does not exist.
         """
         # Try to get from cache
-        cache_key = f"trending_topics:{top_n}:{mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30 minutes cache
-        if cached:
-            return cached
+        mtime = self.parser.latest_output_mtime()
+        cache_key = f"trending_topics:{mtime}:{top_n}:{mode}"
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._build_trending_topics(top_n, mode),
+            ttl=1800  # 30 minutes cache
+        )
 
+    def _build_trending_topics(self, top_n: int, mode: str) -> Dict:
+        """Build the get_trending_topics result (uncached)"""
         # Read today's data
-        all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date()
+        all_titles, _, _ = self.parser.read_all_titles_for_date()
 
         if not all_titles:
             raise DataNotFoundError(
@@ -330,22 +418,11 @@ class DataService:
             titles_to_process = all_titles
 
         elif mode == "current":
-            # current mode: only process the latest batch of data (file with latest timestamp)
-            if timestamps:
-                # Find the latest timestamp
-                latest_timestamp = max(timestamps.values())
-
-                # Re-read, only getting data for the latest time
-                # Here we reverse lookup the platform corresponding to the latest file via timestamps
-                latest_titles, _, _ = self.parser.read_all_titles_for_date()
-
-                # Since read_all_titles_for_date returns merged data from all files,
-                # we need to filter out the latest batch via timestamps.
-                # Simplified implementation: Use all current data as the latest batch
-                # (Precise implementation requires parser service to support filtering by time)
-                titles_to_process = latest_titles
-            else:
-                titles_to_process = all_titles
+            # current mode: only process the latest batch of data.
+            # read_all_titles_for_date returns data merged across all files,
+            # so for now the current data in hand is used as the latest batch
+            # (precise filtering requires parser service support by time)
+            titles_to_process = all_titles
 
         else:
             raise ValueError(
@@ -354,22 +431,29 @@ class DataService:
 
         # Count word frequency
         word_frequency = Counter()
-        keyword_to_news = {}
+        keyword_to_news = defaultdict(set)  # Distinct titles per keyword
+
+        # Each watchlist word with the number of groups listing it: a word in
+        # two groups counts twice per matching title
+        word_weights = Counter(
+            word
+            for group in word_groups
+            for word in group.get("required", []) + group.get("normal", [])
+            if word
+        )
+        any_keyword = _keyword_matcher(tuple(word_weights)) if word_weights else None
 
         # Iterate through titles to process
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
-                # Match against each keyword group
-                for group in word_groups:
-                    all_words = group.get("required", []) + group.get("normal", [])
-
-                    for word in all_words:
-                        if word and word in title:
-                            word_frequency[word] += 1
+                # Most titles contain no watchlist word; skip them in one scan
+                if any_keyword is None or not any_keyword.search(title):
+                    continue
 
-                            if word not in keyword_to_news:
-                                keyword_to_news[word] = []
-                            keyword_to_news[word].append(title)
+                for word, weight in word_weights.items():
+                    if word in title:
+                        word_frequency[word] += weight
+                        keyword_to_news[word].add(title)
 
         # Get TOP N keywords
         top_keywords = word_frequency.most_common(top_n)
@@ -377,12 +461,12 @@ class DataService:
         # Build topic list
         topics = []
         for keyword, frequency in top_keywords:
-            matched_news = keyword_to_news.get(keyword, [])
+            matched_news = keyword_to_news.get(keyword, ())
 
             topics.append({
                 "keyword": keyword,
                 "frequency": frequency,
-                "matched_news": len(set(matched_news)),  # Count distinct news
+                "matched_news": len(matched_news),  # Count distinct news
                 "trend": "stable",  # TODO: Historical data needed to calculate trend
                 "weight_score": 0.0  # TODO: Implement weight calculation
             })
@@ -396,9 +480,6 @@ class DataService:
             "description": self._get_mode_description(mode)
         }
 
-        # Cache result
-        self.cache.set(cache_key, result)
-
         return result
 
     def _get_mode_description(self, mode: str) -> str:
@@ -424,10 +505,14 @@ class DataService:
         """
         # Try to get from cache
         cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1 hour cache
-        if cached:
-            return cached
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._build_current_config(section),
+            ttl=3600  # 1 hour cache
+        )
 
+    def _build_current_config(self, section: str) -> Dict:
+        """Build the get_current_config result (uncached)"""
         # Parse config file
         config_data = self.parser.parse_yaml_config()
         word_groups = self.parser.parse_frequency_words()
@@ -491,9 +576,6 @@ class DataService:
         else:
             result = {}
 
-        # Cache result
-        self.cache.set(cache_key, result)
-
         return result
 
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -508,6 +590,21 @@ class DataService:
             >>> earliest, latest = service.get_available_date_range()
             >>> print(f"Available date range: {earliest} to {latest}")
         """
+        # Folder listing is cached; validators call this per request. Keying on
+        # the output directory's mtime picks up a new date folder immediately
+        try:
+            mtime_ns = os.stat(self.parser.project_root / "output").st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+
+        return self.cache.get_or_compute(
+            f"available_date_range:{mtime_ns}",
+            self._scan_available_date_range,
+            ttl=300
+        )
+
+    def _scan_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Build the get_available_date_range result (uncached)"""
         output_dir = self.parser.project_root / "output"
 
         if not output_dir.exists():
@@ -516,21 +613,14 @@ class DataService:
         available_dates = []
 
         # Iterate through date folders
-        for date_folder in output_dir.iterdir():
-            if date_folder.is_dir() and not date_folder.name.startswith('.'):
-                # Parse date (Format: YYYY年MM月DD日)
-                try:
-                    # Regex matches Chinese format: Year(年)Month(月)Day(日)
-                    date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_folder.name)
-                    if date_match:
-                        folder_date = datetime(
-                            int(date_match.group(1)),
-                            int(date_match.group(2)),
-                            int(date_match.group(3))
-                        )
-                        available_dates.append(folder_date)
-                except Exception:
-                    pass
+        with os.scandir(output_dir) as entries:
+            date_folders = [entry for entry in entries if entry.is_dir()]
+
+        for date_folder in date_folders:
+            if not date_folder.name.startswith('.'):
+                folder_date = _parse_date_folder(date_folder.name)
+                if folder_date:
+                    available_dates.append(folder_date)
 
         if not available_dates:
             return (None, None)
@@ -544,41 +634,26 @@ class DataService:
         Returns:
             System status dictionary.
         """
-        # Get data statistics
-        output_dir = self.parser.project_root / "output"
-
-        total_storage = 0
-        oldest_record = None
-        latest_record = None
+        # Get data statistics. Only the first call walks the output tree
+        # inline; later calls serve the last scan and refresh stale ones in
+        # a background thread
+        storage = self.cache.get_or_compute(
+            "system_status_storage",
+            self._scan_output_storage,
+            ttl=3600
+        )
+        if (time.time() - storage["scanned_at"] > STORAGE_REFRESH_INTERVAL
+                and _storage_refresh_lock.acquire(blocking=False)):
+            try:
+                threading.Thread(target=self._refresh_output_storage, daemon=True).start()
+            except RuntimeError:
+                # No thread could be started; refresh inline, which also
+                # releases the lock so later calls can refresh again
+                self._refresh_output_storage()
 
-        if output_dir.exists():
-            # Iterate through date folders
-            for date_folder in output_dir.iterdir():
-                if date_folder.is_dir():
-                    # Parse date
-                    try:
-                        date_str = date_folder.name
-                        # Format: YYYY年MM月DD日
-                        date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_str)
-                        if date_match:
-                            folder_date = datetime(
-                                int(date_match.group(1)),
-                                int(date_match.group(2)),
-                                int(date_match.group(3))
-                            )
-
-                            if oldest_record is None or folder_date < oldest_record:
-                                oldest_record = folder_date
-                            if latest_record is None or folder_date > latest_record:
-                                latest_record = folder_date
-
-                    except:
-                        pass
-
-                    # Calculate storage size
-                    for item in date_folder.rglob("*"):
-                        if item.is_file():
-                            total_storage += item.stat().st_size
+        total_storage = storage["total_storage"]
+        oldest_record = storage["oldest_record"]
+        latest_record = storage["latest_record"]
 
         # Read version information
         version_file = self.parser.project_root / "version"
@@ -602,4 +677,45 @@ class DataService:
             },
             "cache": self.cache.get_stats(),
             "health": "healthy"
-        }
\ No newline at end of file
+        }
+
+    def _scan_output_storage(self) -> Dict:
+        """Walk the output directory for get_system_status (uncached)"""
+        output_dir = self.parser.project_root / "output"
+
+        total_storage = 0
+        oldest_record = None
+        latest_record = None
+
+        if output_dir.exists():
+            # Iterate through date folders
+            with os.scandir(output_dir) as entries:
+                date_folders = [entry for entry in entries if entry.is_dir()]
+
+            for date_folder in date_folders:
+                # Parse date
+                folder_date = _parse_date_folder(date_folder.name)
+                if folder_date:
+                    if oldest_record is None or folder_date < oldest_record:
+                        oldest_record = folder_date
+                    if latest_record is None or folder_date > latest_record:
+                        latest_record = folder_date
+
+                # Calculate storage size
+                total_storage += _dir_size(date_folder.path)
+
+        return {
+            "total_storage": total_storage,
+            "oldest_record": oldest_record,
+            "latest_record": latest_record,
+            "scanned_at": time.time()
+        }
+
+    def _refresh_output_storage(self) -> None:
+        """Re-scan storage into the cache; runs holding _storage_refresh_lock"""
+        try:
+            self.cache.set("system_status_storage", self._scan_output_storage())
+        except OSError:
+            pass  # Keep serving the previous scan
+        finally:
+            _storage_refresh_lock.release()
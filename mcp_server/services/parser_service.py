@@ -4,6 +4,7 @@ File Parser Service
 Provides parsing functionality for TXT format news data and YAML configuration files.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
@@ -15,6 +16,10 @@ from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
 
+# Runs of whitespace collapsed by clean_title (called once per title line)
+WHITESPACE_RE = re.compile(r'\s+')
+
+
 class ParserService:
     """File Parser Service Class"""
 
@@ -47,7 +52,7 @@ class ParserService:
             Cleaned title.
         """
         # Remove excess whitespace
-        title = re.sub(r'\s+', ' ', title)
+        title = WHITESPACE_RE.sub(' ', title)
         # Remove special characters
         title = title.strip()
         return title
@@ -158,6 +163,33 @@ class ParserService:
         # Using Chinese format for folder names as per existing system convention
         return date.strftime("%Y年%m月%d日")
 
+    def latest_output_mtime(self, date: datetime = None) -> float:
+        """
+        Get the modification watermark of a date's data files.
+
+        Crawls add or rewrite files in the date's txt folder, so the newest
+        mtime of the folder and its files changes whenever its data does.
+        Cache keys that include it stop matching once new data arrives.
+
+        Args:
+            date: Date object, defaults to today.
+
+        Returns:
+            Newest modification time, or 0.0 if the folder does not exist.
+        """
+        txt_dir = self.project_root / "output" / self.get_date_folder_name(date) / "txt"
+
+        try:
+            mtimes = [os.stat(txt_dir).st_mtime]
+            with os.scandir(txt_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".txt"):
+                        mtimes.append(entry.stat().st_mtime)
+        except OSError:
+            return 0.0
+
+        return max(mtimes)
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -169,20 +201,39 @@ class ParserService:
         Args:
             date: Date object, defaults to today.
             platform_ids: List of platform IDs, None means all platforms.
+                Filtered results share the title dicts of the cached
+                all-platform read and must not be mutated.
 
         Returns:
             A tuple (all_titles, id_to_name, all_timestamps)
-            - all_titles: {platform_id: {title: {ranks, url, mobileUrl, ...}}}
+            - all_titles: {platform_id: {title: {ranks, url, mobileUrl, rank_sum, count, avg_rank}}}
+              where rank_sum, count and avg_rank summarize ranks
             - id_to_name: {platform_id: platform_name}
             - all_timestamps: {filename: timestamp}
 
         Raises:
             DataNotFoundError: If data does not exist.
         """
+        if platform_ids:
+            # Filter the cached all-platform read, so analyses looping over
+            # the same dates with different platform filters share one parse
+            all_titles, id_to_name, all_timestamps = self.read_all_titles_for_date(date)
+            filtered_titles = {
+                platform_id: titles
+                for platform_id, titles in all_titles.items()
+                if platform_id in platform_ids
+            }
+            if not filtered_titles:
+                raise DataNotFoundError(
+                    f"No valid data in {self.get_date_folder_name(date)}",
+                    suggestion="Please check data file format or re-run the crawler."
+                )
+            return filtered_titles, id_to_name, all_timestamps
+
         # Generate cache key
         date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
+        mtime = self.latest_output_mtime(date)
+        cache_key = f"read_all_titles:{date_str}:{mtime}"
 
         # Try to get from cache
         # For historical data (not today), use longer cache time (1 hour)
@@ -226,19 +277,24 @@ class ParserService:
 
                 # Merge title data
                 for platform_id, titles in titles_by_id.items():
-                    # If platform filtering is specified
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
-
                     if platform_id not in all_titles:
                         all_titles[platform_id] = {}
 
                     for title, info in titles.items():
-                        if title in all_titles[platform_id]:
+                        ranks = info["ranks"]
+                        merged = all_titles[platform_id].get(title)
+                        if merged is not None:
                             # Merge ranks
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
+                            merged["ranks"].extend(ranks)
+                            merged["rank_sum"] += sum(ranks)
+                            merged["count"] += len(ranks)
                         else:
-                            all_titles[platform_id][title] = info.copy()
+                            merged = all_titles[platform_id][title] = info.copy()
+                            merged["rank_sum"] = sum(ranks)
+                            merged["count"] = len(ranks)
+
+                        # Kept current here so readers need not re-sum ranks
+                        merged["avg_rank"] = merged["rank_sum"] / merged["count"] if merged["count"] else 0
 
                 # Record file timestamp
                 all_timestamps[txt_file.name] = txt_file.stat().st_mtime
@@ -262,7 +318,7 @@ class ParserService:
 
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
-        Parse YAML configuration file.
+        Parse YAML configuration file (with caching).
 
         Args:
             config_path: Path to config file, defaults to config/config.yaml.
@@ -281,6 +337,17 @@ class ParserService:
         if not config_path.exists():
             raise FileParseError(str(config_path), "Configuration file does not exist")
 
+        # Re-parsed only when the file's mtime changes
+        cache_key = f"yaml_config:{config_path}:{config_path.stat().st_mtime}"
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._load_yaml_config(config_path),
+            ttl=3600
+        )
+
+    @staticmethod
+    def _load_yaml_config(config_path: Path) -> dict:
+        """Parse a YAML configuration file (uncached)"""
         try:
             with open(config_path, "r", encoding="utf-8") as f:
                 config_data = yaml.safe_load(f)
@@ -290,7 +357,7 @@ class ParserService:
 
     def parse_frequency_words(self, words_file: str = None) -> List[Dict]:
         """
-        Parse keyword configuration file.
+        Parse keyword configuration file (with caching).
 
         Args:
             words_file: Path to keyword file, defaults to config/frequency_words.txt.
@@ -309,6 +376,17 @@ class ParserService:
         if not words_file.exists():
             return []
 
+        # Re-parsed only when the file's mtime changes
+        cache_key = f"frequency_words:{words_file}:{words_file.stat().st_mtime}"
+        return self.cache.get_or_compute(
+            cache_key,
+            lambda: self._load_frequency_words(words_file),
+            ttl=3600
+        )
+
+    @staticmethod
+    def _load_frequency_words(words_file: Path) -> List[Dict]:
+        """Parse a keyword configuration file (uncached)"""
         word_groups = []
 
         try:
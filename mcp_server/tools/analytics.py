@@ -6,9 +6,12 @@ platform comparison, keyword co-occurrence, and sentiment analysis.
 """
 
 import re
+from bisect import bisect_right
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import accumulate, combinations
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 
 from ..services.data_service import DataService
@@ -22,6 +25,26 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# Threads used to read the days of a date range concurrently
+DATE_READ_WORKERS = 8
+
+# Joins a day's titles into one searchable string; parsed titles have their
+# whitespace collapsed, so they never contain it
+TITLE_SEPARATOR = "\n"
+
+
+class _PlatformStats:
+    """Per-platform counters collected by compare_platforms"""
+
+    __slots__ = ("total_news", "topic_mentions", "unique_titles", "top_keywords")
+
+    def __init__(self):
+        self.total_news = 0
+        self.topic_mentions = 0
+        self.unique_titles = set()
+        self.top_keywords = Counter()
+
+
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
     Calculate news weight (for sorting).
@@ -49,20 +72,22 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     FREQUENCY_WEIGHT = 0.3
     HOTNESS_WEIGHT = 0.1
 
-    # 1. Rank Weight: Σ(11 - min(rank, 10)) / appearance_count
-    rank_scores = []
+    # One pass over ranks feeds both the rank score and the hotness count
+    rank_score_sum = 0
+    high_rank_count = 0
     for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+        rank_score_sum += 11 - min(rank, 10)
+        if rank <= rank_threshold:
+            high_rank_count += 1
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    # 1. Rank Weight: Σ(11 - min(rank, 10)) / appearance_count
+    rank_weight = rank_score_sum / len(ranks)
 
     # 2. Frequency Weight: min(count, 10) * 10
     frequency_weight = min(count, 10) * 10
 
     # 3. Hotness Bonus: high_rank_count / total_count * 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+    hotness_ratio = high_rank_count / len(ranks)
     hotness_weight = hotness_ratio * 100
 
     # Total Weight
@@ -298,45 +323,28 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # Collect trend data
-            trend_data = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # Count topic occurrences for this date
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # Keep only top 3 samples
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
-
-                # Increment day
-                current_date += timedelta(days=1)
+            # Collect trend data as parallel per-day columns; the output
+            # dicts are only assembled once the statistics are done
+            dates = []
+            counts = []
+            samples = []
+
+            # Count topic occurrences for each date
+            for current_date, matched_titles in self._map_dates(
+                lambda date: self._find_topic_titles(topic, date), start_date, end_date
+            ):
+                dates.append(current_date.strftime("%Y-%m-%d"))
+                if matched_titles is None:
+                    # No data for this date
+                    counts.append(0)
+                    samples.append([])
+                else:
+                    counts.append(len(matched_titles))
+                    samples.append(matched_titles[:3])  # Keep only top 3 samples
 
             # Calculate trend indicators
-            counts = [item["count"] for item in trend_data]
             total_days = (end_date - start_date).days + 1
+            total_mentions = sum(counts)
 
             if len(counts) >= 2:
                 # Calculate percentage change
@@ -351,7 +359,7 @@ class AnalyticsTools:
                 # Find peak time
                 max_count = max(counts)
                 peak_index = counts.index(max_count)
-                peak_time = trend_data[peak_index]["date"]
+                peak_time = dates[peak_index]
             else:
                 change_rate = 0
                 peak_time = None
@@ -360,6 +368,11 @@ class AnalyticsTools:
             # Determine trend direction string
             direction = "Rising" if change_rate > 10 else "Falling" if change_rate < -10 else "Stable"
 
+            trend_data = [
+                {"date": date, "count": count, "sample_titles": sample_titles}
+                for date, count, sample_titles in zip(dates, counts, samples)
+            ]
+
             return {
                 "success": True,
                 "topic": topic,
@@ -371,8 +384,8 @@ class AnalyticsTools:
                 "granularity": granularity,
                 "trend_data": trend_data,
                 "statistics": {
-                    "total_mentions": sum(counts),
-                    "average_mentions": round(sum(counts) / len(counts), 2) if counts else 0,
+                    "total_mentions": total_mentions,
+                    "average_mentions": round(total_mentions / len(counts), 2) if counts else 0,
                     "peak_count": max_count,
                     "peak_time": peak_time,
                     "change_rate": round(change_rate, 2)
@@ -428,56 +441,52 @@ class AnalyticsTools:
                 start_date = end_date = datetime.now()
 
             # Collect data per platform
-            platform_stats = defaultdict(lambda: {
-                "total_news": 0,
-                "topic_mentions": 0,
-                "unique_titles": set(),
-                "top_keywords": Counter()
-            })
-
-            # Iterate through date range
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
+            platform_stats = defaultdict(_PlatformStats)
+
+            topic_pattern = re.compile(re.escape(topic), re.IGNORECASE) if topic else None
+
+            # Iterate through date range; days are read concurrently and
+            # aggregated here in date order
+            for _, day_data in self._map_dates(
+                lambda date: self.data_service.parser.read_all_titles_for_date(date=date),
+                start_date,
+                end_date
+            ):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, _ = day_data
 
-                            # Count topic mentions if topic is specified
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    stats = platform_stats[platform_name]
 
-                            # Extract keywords
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
+                    for title in titles.keys():
+                        stats.total_news += 1
+                        stats.unique_titles.add(title)
 
-                except DataNotFoundError:
-                    pass
+                        # Count topic mentions if topic is specified
+                        if topic_pattern and topic_pattern.search(title):
+                            stats.topic_mentions += 1
 
-                current_date += timedelta(days=1)
+                        # Extract keywords
+                        keywords = self._extract_keywords(title)
+                        stats.top_keywords.update(keywords)
 
             # Convert to serializable format
             result_stats = {}
             for platform, stats in platform_stats.items():
                 coverage_rate = 0
-                if stats["total_news"] > 0:
-                    coverage_rate = (stats["topic_mentions"] / stats["total_news"]) * 100
+                if stats.total_news > 0:
+                    coverage_rate = (stats.topic_mentions / stats.total_news) * 100
 
                 result_stats[platform] = {
-                    "total_news": stats["total_news"],
-                    "topic_mentions": stats["topic_mentions"],
-                    "unique_titles": len(stats["unique_titles"]),
+                    "total_news": stats.total_news,
+                    "topic_mentions": stats.topic_mentions,
+                    "unique_titles": len(stats.unique_titles),
                     "coverage_rate": round(coverage_rate, 2),
                     "top_keywords": [
                         {"keyword": k, "count": v}
-                        for k, v in stats["top_keywords"].most_common(5)
+                        for k, v in stats.top_keywords.most_common(5)
                     ]
                 }
 
@@ -535,24 +544,23 @@ class AnalyticsTools:
 
             # Keyword co-occurrence stats
             cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
+            keyword_titles = defaultdict(list)  # Distinct titles per keyword
+            title_keywords = {}  # Title -> its keyword set, tokenized once
 
             for platform_id, titles in all_titles.items():
                 for title in titles.keys():
-                    # Extract keywords
-                    keywords = self._extract_keywords(title)
+                    keywords = title_keywords.get(title)
+                    if keywords is None:
+                        # Extract keywords
+                        keywords = title_keywords[title] = frozenset(self._extract_keywords(title))
 
-                    # Record titles for each keyword
-                    for kw in keywords:
-                        keyword_titles[kw].append(title)
+                        # Record titles for each keyword
+                        for kw in keywords:
+                            keyword_titles[kw].append(title)
 
-                    # Calculate pairwise co-occurrence
-                    if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # Sort to avoid duplicates
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
+                    # Calculate pairwise co-occurrence; sorting the keywords
+                    # once yields every pair in canonical order
+                    cooccurrence.update(combinations(sorted(keywords), 2))
 
             # Filter low frequency pairs
             filtered_pairs = [
@@ -569,7 +577,7 @@ class AnalyticsTools:
                 # Find sample titles containing both keywords
                 titles_with_both = [
                     title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
+                    if kw2 in title_keywords[title]
                 ]
 
                 result_pairs.append({
@@ -649,44 +657,45 @@ class AnalyticsTools:
 
             # Collect news data (supports multiple days)
             all_news_items = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # Collect news for this date
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        for title, info in titles.items():
-                            # Filter by topic if specified
-                            if topic and topic.lower() not in title.lower():
-                                continue
-
-                            news_item = {
-                                "platform": platform_name,
-                                "title": title,
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            }
+            topic_pattern = re.compile(re.escape(topic), re.IGNORECASE) if topic else None
+
+            for current_date, day_data in self._map_dates(
+                lambda date: self.data_service.parser.read_all_titles_for_date(
+                    date=date,
+                    platform_ids=platforms
+                ),
+                start_date,
+                end_date
+            ):
+                if day_data is None:
+                    # No data for this date, continue
+                    continue
+                all_titles, id_to_name, _ = day_data
+                date_str = current_date.strftime("%Y-%m-%d")
 
-                            # Conditionally add URL fields
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+                # Collect news for this date
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    for title, info in titles.items():
+                        # Filter by topic if specified
+                        if topic_pattern and not topic_pattern.search(title):
+                            continue
 
-                            all_news_items.append(news_item)
+                        ranks = info.get("ranks", [])
+                        news_item = {
+                            "platform": platform_name,
+                            "title": title,
+                            "ranks": ranks,
+                            "count": len(ranks),
+                            "date": date_str
+                        }
 
-                except DataNotFoundError:
-                    # No data for this date, continue
-                    pass
+                        # Conditionally add URL fields
+                        if include_url:
+                            news_item["url"] = info.get("url", "")
+                            news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                # Next day
-                current_date += timedelta(days=1)
+                        all_news_items.append(news_item)
 
             if not all_news_items:
                 time_desc = "today" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
@@ -699,20 +708,20 @@ class AnalyticsTools:
             unique_news = {}
             for item in all_news_items:
                 key = f"{item['platform']}::{item['title']}"
-                if key not in unique_news:
-                    unique_news[key] = item
-                else:
-                    # Merge ranks (if news appeared on multiple days)
-                    existing = unique_news[key]
-                    existing["ranks"].extend(item["ranks"])
-                    existing["count"] = len(existing["ranks"])
+                existing = unique_news.setdefault(key, item)
+                if existing is not item:
+                    # Merge ranks (if news appeared on multiple days). The
+                    # lists are the parser's cached ones, so build a new list
+                    # rather than extending in place.
+                    existing["ranks"] = existing["ranks"] + item["ranks"]
+                    existing["count"] += item["count"]
 
             deduplicated_news = list(unique_news.values())
 
             # Sort by weight (if enabled)
             if sort_by_weight:
                 deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
+                    key=calculate_news_weight,
                     reverse=True
                 )
 
@@ -1043,7 +1052,7 @@ class AnalyticsTools:
             # Sort
             if sort_by_weight:
                 related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
+                    key=calculate_news_weight,
                     reverse=True
                 )
             else:
@@ -1387,14 +1396,7 @@ class AnalyticsTools:
             current_date = start_date
             while current_date <= end_date:
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
+                    count = len(self._find_topic_titles(topic, current_date))
                     lifecycle_data.append({
                         "date": current_date.strftime("%Y-%m-%d"),
                         "count": count
@@ -1715,6 +1717,112 @@ class AnalyticsTools:
 
     # ==================== Helper Methods ====================
 
+    def _map_dates(
+        self,
+        func: Callable[[datetime], Any],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Tuple[datetime, Any]]:
+        """
+        Apply func to each day of a date range, several days at a time.
+
+        Per-day reads are mostly file I/O and cache lookups, so a small
+        thread pool overlaps them; callers aggregate the results in order.
+
+        Args:
+            func: Function taking a date; may raise DataNotFoundError.
+            start_date: First date.
+            end_date: Last date (inclusive).
+
+        Returns:
+            List of (date, result) in date order, where result is None for
+            days without data.
+        """
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+
+        def call(date):
+            try:
+                return func(date)
+            except DataNotFoundError:
+                return None
+
+        if len(dates) <= 1:
+            results = [call(date) for date in dates]
+        else:
+            with ThreadPoolExecutor(max_workers=min(DATE_READ_WORKERS, len(dates))) as executor:
+                results = list(executor.map(call, dates))
+
+        return list(zip(dates, results))
+
+    def _get_title_blob(self, date: datetime) -> Tuple[List[str], str, List[int]]:
+        """
+        Get a day's titles joined into one lowercased string (with caching).
+
+        Args:
+            date: Date object.
+
+        Returns:
+            A tuple (titles, blob, starts) where blob is the lowercased
+            titles joined by TITLE_SEPARATOR and starts[i] is the offset of
+            titles[i] in it.
+
+        Raises:
+            DataNotFoundError: If data does not exist.
+        """
+        parser = self.data_service.parser
+
+        def build():
+            all_titles, _, _ = parser.read_all_titles_for_date(date=date)
+            titles = [title for platform_titles in all_titles.values() for title in platform_titles]
+            # Offsets come from the lowercased titles, whose length can differ
+            lowered = [title.lower() for title in titles]
+            starts = [0]
+            starts.extend(accumulate(len(title) + len(TITLE_SEPARATOR) for title in lowered[:-1]))
+            return titles, TITLE_SEPARATOR.join(lowered), starts
+
+        cache_key = f"title_blob:{parser.get_date_folder_name(date)}:{parser.latest_output_mtime(date)}"
+        return self.data_service.cache.get_or_compute(cache_key, build, ttl=3600)
+
+    def _find_topic_titles(self, topic: str, date: datetime) -> List[str]:
+        """
+        Find a day's titles containing a topic, case-insensitively.
+
+        str.find over the day's title blob replaces a lowercase-and-compare
+        per title; hits are mapped back to titles by bisection, and the
+        scan resumes at the next title after each hit.
+
+        Args:
+            topic: Topic keyword.
+            date: Date object.
+
+        Returns:
+            Matching titles in reading order, one entry per platform listing.
+
+        Raises:
+            DataNotFoundError: If data does not exist.
+        """
+        titles, blob, starts = self._get_title_blob(date)
+
+        needle = topic.lower()
+        # Such a topic could only match across two titles
+        if TITLE_SEPARATOR in needle:
+            return []
+
+        matched = []
+        position = blob.find(needle)
+        while position != -1:
+            index = bisect_right(starts, position) - 1
+            matched.append(titles[index])
+            if index + 1 == len(titles):
+                break
+            position = blob.find(needle, starts[index + 1])
+
+        return matched
+
     def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
         """
         Extract keywords from title.
@@ -1761,7 +1869,7 @@ class AnalyticsTools:
         """
         return SequenceMatcher(None, text1, text2).ratio()
 
-    def _find_unique_topics(self, platform_stats: Dict) -> Dict[str, List[str]]:
+    def _find_unique_topics(self, platform_stats: Dict[str, "_PlatformStats"]) -> Dict[str, List[str]]:
         """
         Find unique hot topics for each platform.
 
@@ -1776,20 +1884,17 @@ class AnalyticsTools:
         # Get TOP keywords for each platform
         platform_keywords = {}
         for platform, stats in platform_stats.items():
-            top_keywords = set([kw for kw, _ in stats["top_keywords"].most_common(10)])
-            platform_keywords[platform] = top_keywords
+            platform_keywords[platform] = [kw for kw, _ in stats.top_keywords.most_common(10)]
+
+        # Number of platforms listing each keyword among their TOP keywords
+        keyword_platform_count = Counter(
+            kw for keywords in platform_keywords.values() for kw in keywords
+        )
 
-        # Find unique keywords
+        # Unique keywords are those no other platform lists
         for platform, keywords in platform_keywords.items():
-            # Find keywords present in all other platforms
-            other_keywords = set()
-            for other_platform, other_kws in platform_keywords.items():
-                if other_platform != platform:
-                    other_keywords.update(other_kws)
-
-            # Identify unique ones
-            unique = keywords - other_keywords
+            unique = [kw for kw in keywords if keyword_platform_count[kw] == 1]
             if unique:
-                unique_topics[platform] = list(unique)[:5]  # Max 5
+                unique_topics[platform] = unique[:5]  # Max 5
 
         return unique_topics
\ No newline at end of file
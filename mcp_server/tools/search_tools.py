@@ -190,7 +190,7 @@ class SearchTools:
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
                 from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                all_matches.sort(key=calculate_news_weight, reverse=True)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -251,13 +251,14 @@ class SearchTools:
     ) -> List[Dict]:
         """Keyword Search Mode (Exact Match)"""
         matches = []
-        query_lower = query.lower()
+        # Case-insensitive search without a lowercased copy of each title
+        query_pattern = re.compile(re.escape(query), re.IGNORECASE)
 
         for platform_id, titles in all_titles.items():
             platform_name = id_to_name.get(platform_id, platform_id)
 
             for title, info in titles.items():
-                if query_lower in title.lower():
+                if query_pattern.search(title):
                     news_item = {
                         "title": title,
                         "platform": platform_id,
@@ -325,13 +326,14 @@ class SearchTools:
     ) -> List[Dict]:
         """Entity Search Mode"""
         matches = []
+        query_pattern = re.compile(re.escape(query), re.IGNORECASE)
 
         for platform_id, titles in all_titles.items():
             platform_name = id_to_name.get(platform_id, platform_id)
 
             for title, info in titles.items():
                 # Case-insensitive entity check for English support
-                if query.lower() in title.lower():
+                if query_pattern.search(title):
                     news_item = {
                         "title": title,
                         "platform": platform_id,
@@ -4,6 +4,9 @@ System Management Tools
 Provides functionality for querying system status and triggering crawlers.
 """
 
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -11,6 +14,19 @@ from ..services.data_service import DataService
 from ..utils.validators import validate_platforms
 from ..utils.errors import MCPError, CrawlTaskError
 
+# NewsNow API used by trigger_crawl
+CRAWL_API_URL = "https://newsnow.busiyi.world/api/s?id={}&latest"
+CRAWL_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+    "Cache-Control": "no-cache",
+}
+# Most platform requests in flight at once, and retries per platform
+CRAWL_CONCURRENCY = 8
+CRAWL_MAX_RETRIES = 2
+
 
 class SystemManagementTools:
     """System management tools class"""
@@ -92,9 +108,6 @@ class SystemManagementTools:
             >>> print(result['saved_files'])
         """
         try:
-            import json
-            import time
-            import random
             import requests
             from datetime import datetime
             import pytz
@@ -134,97 +147,45 @@ class SystemManagementTools:
             else:
                 target_platforms = all_platforms
 
-            # Get request interval
+            # Get request interval (milliseconds)
             request_interval = config_data.get("crawler", {}).get("request_interval", 100)
 
-            # Build platform ID list
-            ids = []
-            for platform in target_platforms:
-                if "name" in platform:
-                    ids.append((platform["id"], platform["name"]))
-                else:
-                    ids.append(platform["id"])
+            # Build platform ID -> name mapping, keeping the configured order
+            id_to_name = {
+                platform["id"]: platform.get("name", platform["id"])
+                for platform in target_platforms
+            }
 
-            print(f"Starting temporary crawl. Platforms: {[p.get('name', p['id']) for p in target_platforms]}")
+            print(f"Starting temporary crawl. Platforms: {list(id_to_name.values())}")
 
-            # Crawl data
+            # Crawl data: the platform requests are independent, so fetch
+            # them concurrently (bounded). Request starts are still spaced
+            # out by the configured interval; only slow responses overlap
             results = {}
-            id_to_name = {}
             failed_ids = []
 
-            for i, id_info in enumerate(ids):
-                if isinstance(id_info, tuple):
-                    id_value, name = id_info
-                else:
-                    id_value = id_info
-                    name = id_value
-
-                id_to_name[id_value] = name
-
-                # Build request URL
-                url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
-
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/json, text/plain, */*",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Connection": "keep-alive",
-                    "Cache-Control": "no-cache",
-                }
-
-                # Retry mechanism
-                max_retries = 2
-                retries = 0
-                success = False
-
-                while retries <= max_retries and not success:
-                    try:
-                        response = requests.get(url, headers=headers, timeout=10)
-                        response.raise_for_status()
-
-                        data_text = response.text
-                        data_json = json.loads(data_text)
-
-                        status = data_json.get("status", "unknown")
-                        if status not in ["success", "cache"]:
-                            raise ValueError(f"Abnormal response status: {status}")
-
-                        status_info = "Latest Data" if status == "success" else "Cached Data"
-                        print(f"Successfully retrieved {id_value} ({status_info})")
-
-                        # Parse data
-                        results[id_value] = {}
-                        for index, item in enumerate(data_json.get("items", []), 1):
-                            title = item["title"]
-                            url_link = item.get("url", "")
-                            mobile_url = item.get("mobileUrl", "")
-
-                            if title in results[id_value]:
-                                results[id_value][title]["ranks"].append(index)
-                            else:
-                                results[id_value][title] = {
-                                    "ranks": [index],
-                                    "url": url_link,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                        success = True
-
-                    except Exception as e:
-                        retries += 1
-                        if retries <= max_retries:
-                            wait_time = random.uniform(3, 5)
-                            print(f"Request to {id_value} failed: {e}. Retrying in {wait_time:.2f} seconds...")
-                            time.sleep(wait_time)
-                        else:
-                            print(f"Request to {id_value} failed: {e}")
+            session = requests.Session()
+            session.headers.update(CRAWL_HEADERS)
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=min(CRAWL_CONCURRENCY, len(id_to_name))
+                ) as executor:
+                    futures = {}
+                    for i, id_value in enumerate(id_to_name):
+                        if i:
+                            actual_interval = request_interval + random.randint(-10, 20)
+                            actual_interval = max(50, actual_interval)
+                            time.sleep(actual_interval / 1000)
+                        futures[id_value] = executor.submit(self._fetch_platform, session, id_value)
+
+                    for id_value, future in futures.items():
+                        titles = future.result()
+                        if titles is None:
                             failed_ids.append(id_value)
-
-                # Request interval
-                if i < len(ids) - 1:
-                    actual_interval = request_interval + random.randint(-10, 20)
-                    actual_interval = max(50, actual_interval)
-                    time.sleep(actual_interval / 1000)
+                        else:
+                            results[id_value] = titles
+            finally:
+                session.close()
 
             # Format return data
             news_data = []
@@ -379,6 +340,56 @@ class SystemManagementTools:
                 }
             }
 
+    def _fetch_platform(self, session, id_value: str) -> Optional[Dict]:
+        """
+        Fetch the latest titles of one platform, with retries.
+
+        Args:
+            session: requests.Session shared by the crawl.
+            id_value: Platform ID.
+
+        Returns:
+            {title: {ranks, url, mobileUrl}}, or None if every attempt failed.
+        """
+        url = CRAWL_API_URL.format(id_value)
+
+        for attempt in range(CRAWL_MAX_RETRIES + 1):
+            try:
+                response = session.get(url, timeout=10)
+                response.raise_for_status()
+                data_json = response.json()
+
+                status = data_json.get("status", "unknown")
+                if status not in ["success", "cache"]:
+                    raise ValueError(f"Abnormal response status: {status}")
+
+                status_info = "Latest Data" if status == "success" else "Cached Data"
+                print(f"Successfully retrieved {id_value} ({status_info})")
+
+                # Parse data
+                titles = {}
+                for index, item in enumerate(data_json.get("items", []), 1):
+                    title = item["title"]
+                    if title in titles:
+                        titles[title]["ranks"].append(index)
+                    else:
+                        titles[title] = {
+                            "ranks": [index],
+                            "url": item.get("url", ""),
+                            "mobileUrl": item.get("mobileUrl", ""),
+                        }
+                return titles
+
+            except Exception as e:
+                if attempt < CRAWL_MAX_RETRIES:
+                    wait_time = random.uniform(3, 5)
+                    print(f"Request to {id_value} failed: {e}. Retrying in {wait_time:.2f} seconds...")
+                    time.sleep(wait_time)
+                else:
+                    print(f"Request to {id_value} failed: {e}")
+
+        return None
+
     def _generate_simple_html(self, results: Dict, id_to_name: Dict, failed_ids: List, now) -> str:
         """Generate simplified HTML report"""
         html = """<!DOCTYPE html>
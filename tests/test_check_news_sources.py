@@ -0,0 +1,39 @@
+"""
+Regression tests for check_news_sources
+
+Run with: python -m unittest discover tests
+"""
+
+import socket
+import unittest
+from unittest import mock
+
+import check_news_sources
+
+
+class CachedDnsTests(unittest.TestCase):
+
+    def test_import_leaves_getaddrinfo_untouched(self):
+        self.assertIs(socket.getaddrinfo, check_news_sources.socket.getaddrinfo)
+        self.assertEqual(socket.getaddrinfo.__module__, 'socket')
+
+    def test_lookups_are_memoized_inside_the_block_only(self):
+        original = socket.getaddrinfo
+        with mock.patch('socket.getaddrinfo', return_value=['addr']) as resolver:
+            with check_news_sources.cached_dns():
+                socket.getaddrinfo('example.com', 443)
+                socket.getaddrinfo('example.com', 443)
+            self.assertIs(socket.getaddrinfo, resolver)
+        self.assertEqual(resolver.call_count, 1)
+        self.assertIs(socket.getaddrinfo, original)
+
+    def test_resolver_is_restored_on_error(self):
+        original = socket.getaddrinfo
+        with self.assertRaises(RuntimeError):
+            with check_news_sources.cached_dns():
+                raise RuntimeError('boom')
+        self.assertIs(socket.getaddrinfo, original)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+Regression tests for fetch_english_news categorization
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+from datetime import datetime, timezone
+
+import fetch_english_news
+
+
+def categorize_title(title: str) -> str:
+    """Return the category a single title is filed under"""
+    item = fetch_english_news.make_news_item(
+        'Test Source', title, 'https://example.com/story', datetime.now(timezone.utc)
+    )
+    categorized = fetch_english_news.categorize_news([item])
+    return next(category for category, items in categorized.items() if item in items)
+
+
+class CategorizeNewsTests(unittest.TestCase):
+
+    def test_overlapping_lower_priority_keyword_does_not_hide_higher_one(self):
+        # "series a" (Startups & Funding) starts earlier and overlaps "ai"
+        self.assertEqual(categorize_title('Series AI startup raises'), 'AI & Machine Learning')
+
+    def test_highest_priority_category_wins(self):
+        self.assertEqual(categorize_title('Startup raises Series B for AI chips'), 'AI & Machine Learning')
+
+    def test_uncategorized_title_goes_to_general(self):
+        self.assertEqual(categorize_title('Weather is mild today'), 'General Tech News')
+
+
+if __name__ == '__main__':
+    unittest.main()